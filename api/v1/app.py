@@ -8,8 +8,41 @@ from flask_cors import CORS
 import os
 from models import storage
 from flask import Flask, jsonify, make_response
+from flask.json.provider import JSONProvider
+from models.engine import serializer
+
+
+class StorageJSONProvider(JSONProvider):
+    """
+    Encodes and decodes the API's JSON with the storage serializer.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize obj to a JSON string.
+        """
+        return serializer.dumps(obj)
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize the JSON string or bytes s.
+        """
+        return serializer.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Build an application/json response without an extra decode, from
+        one value, several values as a list, or keyword arguments as a dict.
+        """
+        if args and kwargs:
+            raise TypeError("response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else args or kwargs or None
+        return self._app.response_class(serializer.dumpb(obj),
+                                        mimetype="application/json")
+
 
 app = Flask(__name__)
+app.json = StorageJSONProvider(app)
 app.url_map.strict_slashes = False
 CORS(app, resources={"/*": {"origins": "0.0.0.0"}})
 app.register_blueprint(app_views, url_prefix="/api/v1")
@@ -6,6 +6,8 @@ View for Amenity objects that handles RESTful API actions.
 from models import storage
 from models.amenity import Amenity
 from api.v1.views import app_views
+from api.v1.views.pagination import page_limit, paginate
+from api.v1.views.streaming import stream_response
 from flasgger.utils import swag_from
 from flask import abort, jsonify, make_response, request
 
@@ -14,15 +16,13 @@ from flask import abort, jsonify, make_response, request
 def get_amenities():
 
     """
-    Retrieves all amenities.
+    Retrieves all amenities, or one page of them with ?limit=&after=.
     """
-    amenities = storage.all(Amenity).values()
-    amenities_list = []
-
-    for amenity in amenities:
-        amenities_list.append(amenity.to_dict())
-
-    return jsonify(amenities_list)
+    limit = page_limit()
+    if limit is not None:
+        return paginate(Amenity, limit)
+    return stream_response(amenity.to_dict(format_dates=False)
+                           for amenity in storage.stream(Amenity))
 
 
 @app_views.route("/amenities/<amenity_id>", methods=["GET"])
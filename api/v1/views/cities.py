@@ -7,6 +7,7 @@ from models import storage
 from models.city import City
 from models.state import State
 from api.v1.views import app_views
+from api.v1.views.streaming import stream_response
 from flasgger.utils import swag_from
 from flask import abort, jsonify, make_response, request
 
@@ -17,16 +18,13 @@ def get_cities_by_state(state_id):
     """
     Retrieves all cities associated with a given state.
     """
-    list_cities = []
     state = storage.get(State, state_id)
 
     if not state:
         abort(404)
 
-    for city in state.cities:
-        list_cities.append(city.to_dict())
-
-    return jsonify(list_cities)
+    return stream_response(city.to_dict(format_dates=False) for city in
+                           storage.stream(City, {"state_id": state_id}))
 
 
 @app_views.route("/cities/<city_id>", methods=["GET"])
@@ -5,10 +5,11 @@ Define routes for API status and statistics.
 
 from models.amenity import Amenity
 from api.v1.views import app_views
+from flask import abort
 from models.state import State
 from models.city import City
 from models.user import User
-from models import storage
+from models import storage, storage_t
 from models.place import Place
 from models.review import Review
 
@@ -33,7 +34,18 @@ def api_stats():
     """
     class_list = [Amenity, City, State, Place, Review, User]
     names = ["amenities", "cities", "states", "places", "reviews", "users"]
-    statistics = {}
-    for name, cls in zip(names, class_list):
-        statistics[name] = storage.count(cls=cls)
-    return statistics
+    counts = storage.counts(class_list)
+    return {name: counts[cls.__name__]
+            for name, cls in zip(names, class_list)}
+
+
+@app_views.route("/metrics")
+def api_metrics():
+    """
+    Retrieve the database connection pool usage and checkout wait times.
+    Returns:
+    dict: A dictionary of pool metrics, 404 outside of DBStorage.
+    """
+    if storage_t != "db":
+        abort(404)
+    return storage.metrics()
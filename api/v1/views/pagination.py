@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+Keyset pagination shared by the collection endpoints: ?limit=n returns
+{"results": [...], "next": cursor}, and ?after=cursor the following page.
+"""
+
+from models import storage
+from flask import abort, jsonify, request
+
+
+def page_limit():
+    """
+    Read the page size of the request.
+    Returns:
+        int: The ?limit= value, or None when the request has none.
+    """
+    limit = request.args.get("limit")
+    if limit is None:
+        return None
+    if not limit.isdigit() or not int(limit):
+        abort(400, description="Invalid limit")
+    return int(limit)
+
+
+def page_response(results, limit):
+    """
+    Build the response for a page read with limit + 1 rows.
+    Returns:
+        Response: The first limit results and the cursor of the last one,
+        or None as the cursor when no row follows.
+    """
+    cursor = results[limit - 1]["id"] if len(results) > limit else None
+    return jsonify({"results": results[:limit], "next": cursor})
+
+
+def paginate(cls, limit, where=None):
+    """
+    Retrieve the page of cls objects following the ?after= cursor.
+    Returns:
+        Response: The page built by page_response().
+    """
+    objs = storage.page(cls, after=request.args.get("after"),
+                        limit=limit + 1, where=where)
+    return page_response([obj.to_dict(format_dates=False) for obj in objs],
+                         limit)
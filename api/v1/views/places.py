@@ -9,6 +9,8 @@ from models.user import User
 from models.place import Place
 from models.state import State
 from api.v1.views import app_views
+from api.v1.views.pagination import page_limit, page_response, paginate
+from api.v1.views.streaming import stream_response
 from models.amenity import Amenity
 from flasgger.utils import swag_from
 from flask import jsonify, abort, request, make_response
@@ -18,15 +20,18 @@ from flask import jsonify, abort, request, make_response
 def get_places(city_id):
 
     """
-    Retrieve all places in a specific city.
+    Retrieve all places in a specific city, or one page of them with
+    ?limit=&after=.
     """
-    city = storage.get(City, city_id)
-    if city is None:
+    limit = page_limit()
+    if storage.get(City, city_id) is None:
         abort(404)
 
-    places = [obj.to_dict() for obj in city.places]
+    if limit is not None:
+        return paginate(Place, limit, {"city_id": city_id})
 
-    return jsonify(places)
+    return stream_response(obj.to_dict(format_dates=False) for obj in
+                           storage.stream(Place, {"city_id": city_id}))
 
 
 @app_views.route("/places/<place_id>")
@@ -103,53 +108,26 @@ def search_places():
     if request.get_json() is None:
         return make_response(jsonify({"error": "Not a JSON"}), 400)
 
-    data = request.get_json()
-
-    if data and len(data):
-        states = data.get('states', None)
-        cities = data.get('cities', None)
-        amenities = data.get('amenities', None)
-
-    if not data or not len(data) or (
-            not states and
-            not cities and
-            not amenities):
-        places = storage.all(Place).values()
-        list_places = []
-        for place in places:
-            list_places.append(place.to_dict())
-        return jsonify(list_places)
-
-    list_places = []
-    if states:
-        states_obj = [storage.get(State, s_id) for s_id in states]
-        for state in states_obj:
-            if state:
-                for city in state.cities:
-                    if city:
-                        for place in city.places:
-                            list_places.append(place)
-
-    if cities:
-        city_obj = [storage.get(City, c_id) for c_id in cities]
-        for city in city_obj:
-            if city:
-                for place in city.places:
-                    if place not in list_places:
-                        list_places.append(place)
-
-    if amenities:
-        if not list_places:
-            list_places = storage.all(Place).values()
-        amenities_obj = [storage.get(Amenity, a_id) for a_id in amenities]
-        list_places = [place for place in list_places
-                       if all([am in place.amenities
-                               for am in amenities_obj])]
-
-    places = []
-    for place in list_places:
-        dict = place.to_dict()
-        dict.pop('amenities', None)
-        places.append(dict)
-
-    return jsonify(places)
+    data = request.get_json() or {}
+    limit = page_limit()
+
+    found = storage.search_places(states=data.get('states') or (),
+                                  cities=data.get('cities') or (),
+                                  amenities=data.get('amenities') or (),
+                                  after=request.args.get("after"),
+                                  limit=limit + 1 if limit else None,
+                                  stream=limit is None)
+
+    places = (_search_result(place) for place in found)
+    if limit is None:
+        return stream_response(places)
+    return page_response(list(places), limit)
+
+
+def _search_result(place):
+    """
+    Build the dict of a place found by search_places().
+    """
+    dict = place.to_dict(format_dates=False)
+    dict.pop('amenities', None)
+    return dict
@@ -24,10 +24,12 @@ def get_place_amenities(place_id):
         abort(404)
 
     if environ.get('HBNB_TYPE_STORAGE') == "db":
-        amenities = [amenity.to_dict() for amenity in place.amenities]
+        amenities = [amenity.to_dict(format_dates=False)
+                     for amenity in place.amenities]
 
     else:
-        amenities = [storage.get(Amenity, amenity_id).to_dict()
+        amenities = [storage.get(Amenity, amenity_id).to_dict(
+                     format_dates=False)
                      for amenity_id in place.amenity_ids]
 
     return jsonify(amenities)
@@ -59,7 +61,8 @@ def delete_place_amenity(place_id, amenity_id):
         if amenity_id not in place.amenity_ids:
             abort(404)
 
-        place.amenity_ids.remove(amenity_id)
+        place.amenity_ids = [a_id for a_id in place.amenity_ids
+                             if a_id != amenity_id]
 
     storage.save()
     return make_response(jsonify({}), 200)
@@ -92,7 +95,7 @@ def update_place_amenity(place_id, amenity_id):
             return make_response(jsonify(amenity.to_dict()), 200)
 
         else:
-            place.amenity_ids.append(amenity_id)
+            place.amenity_ids = place.amenity_ids + [amenity_id]
 
     storage.save()
 
@@ -8,6 +8,8 @@ from models.user import User
 from models.place import Place
 from models.review import Review
 from api.v1.views import app_views
+from api.v1.views.pagination import page_limit, paginate
+from api.v1.views.streaming import stream_response
 from flasgger.utils import swag_from
 from flask import abort, jsonify, make_response, request
 
@@ -16,16 +18,20 @@ from flask import abort, jsonify, make_response, request
 def get_reviews(place_id):
 
     """
-    Retrieve all reviews for a specific place.
+    Retrieve all reviews for a specific place, or one page of them with
+    ?limit=&after=.
     """
+    limit = page_limit()
     place = storage.get(Place, place_id)
 
     if not place:
         abort(404)
 
-    reviews = [review.to_dict() for review in place.reviews]
+    if limit is not None:
+        return paginate(Review, limit, {"place_id": place_id})
 
-    return jsonify(reviews)
+    return stream_response(review.to_dict(format_dates=False) for review in
+                           storage.stream(Review, {"place_id": place_id}))
 
 
 @app_views.route("/reviews/<review_id>")
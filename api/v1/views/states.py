@@ -6,6 +6,8 @@ API routes for managing states.
 from models import storage
 from models.state import State
 from api.v1.views import app_views
+from api.v1.views.pagination import page_limit, paginate
+from api.v1.views.streaming import stream_response
 from flasgger.utils import swag_from
 from flask import abort, jsonify, make_response, request
 
@@ -14,15 +16,13 @@ from flask import abort, jsonify, make_response, request
 def get_states():
 
     """
-    Retrieve all states.
+    Retrieve all states, or one page of them with ?limit=&after=.
     """
-    states_list = storage.all(State).values()
-    list_of_states = []
-
-    for state in states_list:
-        list_of_states.append(state.to_dict())
-
-    return jsonify(list_of_states)
+    limit = page_limit()
+    if limit is not None:
+        return paginate(State, limit)
+    return stream_response(state.to_dict(format_dates=False)
+                           for state in storage.stream(State))
 
 
 @app_views.route("/states/<string:state_id>", methods=["GET"])
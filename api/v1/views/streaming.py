@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Streamed responses for the collection endpoints: a JSON array written in
+chunks as the rows are produced, or one JSON object per line when the client
+accepts application/x-ndjson.
+"""
+
+from itertools import islice
+from models.engine import serializer
+from flask import Response, request, stream_with_context
+
+BATCH_SIZE = 500
+NDJSON = "application/x-ndjson"
+
+
+def stream_response(results):
+    """
+    Build a response streaming the dicts of the iterable results.
+    Returns:
+        Response: A chunked application/json array, or application/x-ndjson
+        lines when the Accept header prefers them.
+    """
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON])
+    ndjson = best == NDJSON
+    return Response(stream_with_context(_chunks(results, ndjson)),
+                    mimetype=NDJSON if ndjson else "application/json")
+
+
+def _chunks(results, ndjson):
+    """
+    Encode the dicts of results BATCH_SIZE at a time.
+    Yields:
+        bytes: One piece of the body per batch.
+    """
+    results = iter(results)
+    first = True
+    while True:
+        batch = list(islice(results, BATCH_SIZE))
+        if not batch:
+            break
+        if ndjson:
+            yield b"".join(serializer.dumpb(result) + b"\n"
+                           for result in batch)
+        else:
+            yield (b"[" if first else b",") + serializer.dumpb(batch)[1:-1]
+        first = False
+    if not ndjson:
+        yield b"[]" if first else b"]"
@@ -5,6 +5,8 @@ User API endpoints for handling user objects.
 from models import storage
 from models.user import User
 from api.v1.views import app_views
+from api.v1.views.pagination import page_limit, paginate
+from api.v1.views.streaming import stream_response
 from flask import abort, jsonify, make_response, request
 
 
@@ -12,10 +14,13 @@ from flask import abort, jsonify, make_response, request
 def get_users():
 
     """
-    Retrieve all users.
+    Retrieve all users, or one page of them with ?limit=&after=.
     """
-    users = [user.to_dict() for user in storage.all(User).values()]
-    return make_response(jsonify(users), 200)
+    limit = page_limit()
+    if limit is not None:
+        return paginate(User, limit)
+    return stream_response(user.to_dict(format_dates=False)
+                           for user in storage.stream(User))
 
 
 @app_views.route("/users/<string:user_id>", methods=["GET"])
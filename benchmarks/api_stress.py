@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Hammers the states and stats routes of the API from many threads at once
+
+Usage: python3 -m benchmarks.api_stress [threads] [requests per thread]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from api.v1.app import app
+from models import storage
+
+
+def client_loop(n, requests, errors):
+    """creates, reads, updates and deletes states through the API"""
+    client = app.test_client()
+    try:
+        for i in range(requests):
+            resp = client.post("/api/v1/states",
+                               json={"name": "State {}-{}".format(n, i)})
+            state_id = resp.get_json()["id"]
+            for resp in [client.get("/api/v1/states"),
+                         client.get("/api/v1/states/" + state_id),
+                         client.put("/api/v1/states/" + state_id,
+                                    json={"name": "Renamed"}),
+                         client.get("/api/v1/stats"),
+                         client.delete("/api/v1/states/" + state_id)]:
+                if resp.status_code != 200:
+                    errors.append("{} {}".format(resp.status_code,
+                                                 resp.request.path))
+    except Exception as e:
+        errors.append(repr(e))
+
+
+def main(threads, requests):
+    """runs threads clients and reports throughput and failures"""
+    tmp = tempfile.TemporaryDirectory()
+    storage._FileStorage__file_path = os.path.join(tmp.name, "file.json")
+    errors = []
+    workers = [threading.Thread(target=client_loop,
+                                args=(n, requests, errors))
+               for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    total = threads * requests * 6
+    print("threads: {}, requests: {}".format(threads, total))
+    print("elapsed: {:.2f} s, {:.0f} requests/s".format(
+        elapsed, total / elapsed))
+    print("failures: {}".format(len(errors)))
+    for error in errors[:10]:
+        print("  " + error)
+    tmp.cleanup()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 5))
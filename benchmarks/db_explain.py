@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""
+Checks with EXPLAIN that the lookups behind the API routes use the indexes
+declared on the models, and exits with 1 if one does not
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_URL=sqlite:///bench.db \\
+    python3 -m benchmarks.db_explain
+"""
+
+import sys
+import models
+from models import storage
+from models.city import City
+from models.place import Place, place_amenity
+from models.review import Review
+from models.user import User
+from sqlalchemy import select
+
+
+def hot_queries():
+    """returns (route, index name, query) for each indexed lookup"""
+    session = storage._DBStorage__session
+    return [
+        ("GET /states/<id>/cities", "ix_cities_state_id",
+         session.query(City).filter(City.state_id == "id")),
+        ("GET /cities/<id>/places", "ix_places_city_id_price_by_night",
+         session.query(Place).filter(Place.city_id == "id")),
+        ("places by city and price", "ix_places_city_id_price_by_night",
+         session.query(Place).filter(Place.city_id == "id",
+                                     Place.price_by_night <= 100)),
+        ("places of a user", "ix_places_user_id",
+         session.query(Place).filter(Place.user_id == "id")),
+        ("GET /places/<id>/reviews", "ix_reviews_place_id",
+         session.query(Review).filter(Review.place_id == "id")),
+        ("reviews of a user", "ix_reviews_user_id",
+         session.query(Review).filter(Review.user_id == "id")),
+        ("user by email", "ix_users_email",
+         session.query(User).filter(User.email == "a@b.c")),
+        ("POST /places_search amenities", "ix_place_amenity_amenity_id",
+         select(place_amenity.c.place_id).where(
+             place_amenity.c.amenity_id.in_(["a", "b"])))]
+
+
+def main():
+    """explains every hot query and reports the ones not using its index"""
+    if models.storage_t != "db":
+        print("set HBNB_TYPE_STORAGE=db and HBNB_MYSQL_URL")
+        return 2
+    created = storage.migrate()
+    if created:
+        print("created: {}".format(", ".join(created)))
+    failures = 0
+    for route, index, query in hot_queries():
+        plan = storage.explain(query)
+        used = any(index in line for line in plan)
+        failures += not used
+        print("{:<4} {:<32} {}".format("ok" if used else "FAIL", route,
+                                       index))
+        if not used:
+            for line in plan:
+                print("       " + line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Reads states and stats through the API from many threads on DBStorage and
+reports the connection pool usage and checkout wait times
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_URL=sqlite:///bench.db \\
+    python3 -m benchmarks.db_pool [threads] [requests per thread]
+
+Set HBNB_MYSQL_POOL_SIZE, HBNB_MYSQL_MAX_OVERFLOW and HBNB_MYSQL_POOL_TIMEOUT
+to compare pool settings.
+"""
+
+import sys
+import threading
+import time
+from api.v1.app import app
+import models
+from models import storage
+from models.state import State
+
+
+def client_loop(requests, errors):
+    """reads the states and stats routes of the API"""
+    client = app.test_client()
+    try:
+        for i in range(requests):
+            for resp in [client.get("/api/v1/states"),
+                         client.get("/api/v1/stats")]:
+                if resp.status_code != 200:
+                    errors.append("{} {}".format(resp.status_code,
+                                                 resp.request.path))
+    except Exception as e:
+        errors.append(repr(e))
+
+
+def main(threads, requests):
+    """runs threads clients and reports throughput and pool metrics"""
+    if models.storage_t != "db":
+        print("set HBNB_TYPE_STORAGE=db and HBNB_MYSQL_URL")
+        return 2
+    for i in range(100 - storage.count(State)):
+        storage.new(State(name="State {}".format(i)))
+    storage.save()
+    storage.close()
+    errors = []
+    workers = [threading.Thread(target=client_loop, args=(requests, errors))
+               for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    total = threads * requests * 2
+    print("threads: {}, requests: {}".format(threads, total))
+    print("elapsed: {:.2f} s, {:.0f} requests/s".format(
+        elapsed, total / elapsed))
+    print("failures: {}".format(len(errors)))
+    for error in errors[:10]:
+        print("  " + error)
+    for name, value in storage.metrics().items():
+        print("{}: {}".format(name, value))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 10))
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Counts the statements DBStorage sends for the relationship-heavy routes,
+for a small and a large data set
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_URL=sqlite:///bench.db \\
+    python3 -m benchmarks.db_queries [states]
+"""
+
+import importlib
+import sys
+import time
+from api.v1.app import app
+import models
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+
+
+def fill(states):
+    """adds states with two cities of two places each, all with wifi"""
+    user = User(email="u@hbnb.io", password="pwd")
+    wifi = Amenity(name="Wifi")
+    storage.new(user)
+    storage.new(wifi)
+    for i in range(states):
+        state = State(name="State {}".format(i))
+        storage.new(state)
+        for j in range(2):
+            city = City(name="City {}".format(j), state_id=state.id)
+            storage.new(city)
+            for k in range(2):
+                place = Place(name="Place", city_id=city.id,
+                              user_id=user.id)
+                place.amenities.append(wifi)
+                storage.new(place)
+    storage.save()
+    storage.close()
+    return state, city, wifi
+
+
+def measure(label, func):
+    """calls func and prints the statements it sent and its latency"""
+    with storage.count_statements() as statements:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    print("  {:<32} {:>4} statements {:>8.2f} ms".format(
+        label, len(statements), elapsed * 1000))
+
+
+def main(states):
+    """fills the database twice and counts the statements of each route"""
+    if models.storage_t != "db":
+        print("set HBNB_TYPE_STORAGE=db and HBNB_MYSQL_URL")
+        return 2
+    client = app.test_client()
+    web = importlib.import_module("web_flask.8-cities_by_states").app
+    web_client = web.test_client()
+    for total in [states // 10 or 1, states]:
+        state, city, wifi = fill(total - storage.count(State))
+        ids = [s.id for s in storage.all(State).values()]
+        storage.close()
+        print("{} states".format(storage.count(State)))
+        storage.close()
+        measure("GET /states/<id>/cities", lambda: client.get(
+            "/api/v1/states/{}/cities".format(state.id)))
+        measure("GET /cities/<id>/places", lambda: client.get(
+            "/api/v1/cities/{}/places".format(city.id)))
+        measure("POST /places_search", lambda: client.post(
+            "/api/v1/places_search",
+            json={"states": ids, "amenities": [wifi.id]}))
+        measure("GET /cities_by_states", lambda: web_client.get(
+            "/cities_by_states"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""
+Counts the statements and times /stats and all() on DBStorage, with one
+query per class and with the multi-class path
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_URL=sqlite:///bench.db \\
+    python3 -m benchmarks.db_round_trips [objects per class] [repeats]
+"""
+
+import sys
+import time
+import models
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.engine.db_storage import classes
+from models.state import State
+from models.user import User
+
+
+def measure(label, func, repeats):
+    """runs func repeats times and prints its statements and latency"""
+    with storage.count_statements() as statements:
+        start = time.perf_counter()
+        for i in range(repeats):
+            func()
+            storage.close()
+        elapsed = time.perf_counter() - start
+    print("{:<24} {:>4} statements {:>9.2f} ms".format(
+        label, len(statements) // repeats, elapsed / repeats * 1000))
+
+
+def main(total, repeats):
+    """fills the database and compares both paths"""
+    if models.storage_t != "db":
+        print("set HBNB_TYPE_STORAGE=db and HBNB_MYSQL_URL")
+        return 2
+    if storage.count(State) < total:
+        for i in range(total):
+            state = State(name="State")
+            storage.new(state)
+            storage.new(City(name="City", state_id=state.id))
+            storage.new(User(email="u@hbnb.io", password="pwd"))
+            storage.new(Amenity(name="Wifi"))
+        storage.save()
+        storage.close()
+    session = storage._DBStorage__session
+    measure("count per class", lambda: [
+        session.query(cls).count() for cls in classes.values()],
+        repeats)
+    measure("counts()", storage.counts, repeats)
+    measure("all() per class", lambda: [
+        session.query(cls).all() for cls in classes.values()],
+        repeats)
+    storage._DBStorage__load_workers = 1
+    measure("all()", storage.all, repeats)
+    storage._DBStorage__load_workers = len(classes)
+    measure("all(), 6 workers", storage.all, repeats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 10))
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Compares save() latency and disk writes of the FileStorage durability modes
+
+Usage: python3 -m benchmarks.durability [objects] [threads] [saves per thread]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+from models.engine.file_storage import FileStorage
+from models.state import State
+
+
+def run(mode, states, threads, saves):
+    """times saves from threads with HBNB_FILE_DURABILITY set to mode"""
+    with mock.patch.dict(os.environ, {"HBNB_FILE_DURABILITY": mode}):
+        storage = FileStorage()
+    tmp = tempfile.TemporaryDirectory()
+    storage._FileStorage__file_path = os.path.join(tmp.name, "file.json")
+    storage.save()
+    writes = []
+    write = storage._write
+
+    def counted_write(path, parts):
+        """counts and performs one file write"""
+        writes.append(path)
+        write(path, parts)
+
+    storage._write = counted_write
+    latencies = []
+
+    def worker(n):
+        """renames one state and times each save"""
+        for i in range(saves):
+            states[n].name = "State {} {}".format(n, i)
+            start = time.perf_counter()
+            storage.save()
+            latencies.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=worker, args=(n,))
+               for n in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    if storage._FileStorage__flusher:
+        storage._FileStorage__flusher.stop()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print("{:>12} {:>10.2f} {:>10.2f} {:>8} {:>10.2f}".format(
+        mode, latencies[len(latencies) // 2] * 1000, latencies[-1] * 1000,
+        len(writes), elapsed))
+    tmp.cleanup()
+
+
+def main(total, threads, saves):
+    """fills the storage and runs every durability mode"""
+    storage = FileStorage()
+    states = []
+    for i in range(total):
+        state = State(name="State {}".format(i))
+        storage.new(state)
+        states.append(state)
+    print("objects: {}, saves: {}".format(total, threads * saves))
+    print("{:>12} {:>10} {:>10} {:>8} {:>10}".format(
+        "durability", "p50 (ms)", "max (ms)", "writes", "total (s)"))
+    for mode in ["sync", "interval", "fsync-group"]:
+        run(mode, states, threads, saves)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 16,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 20)
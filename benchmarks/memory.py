@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Measures the memory FileStorage holds per object with tracemalloc
+
+Usage: python3 -m benchmarks.memory [objects per class]
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from models.city import City
+from models.engine import snapshot
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+def dataset(total):
+    """returns the to_dict() of states, cities, users, places and reviews
+    linked the way the API links them"""
+    parents = max(total // 50, 1)
+    states = [State(name="State {}".format(i)) for i in range(parents)]
+    cities = [City(name="City {}".format(i), state_id=states[i % parents].id)
+              for i in range(total)]
+    users = [User(email="u{}@hbnb.io".format(i), password="pwd")
+             for i in range(total)]
+    places = [Place(name="Place {}".format(i), city_id=cities[i].id,
+                    user_id=users[i].id, number_rooms=i % 5)
+              for i in range(total)]
+    reviews = [Review(text="Great stay", place_id=places[i % total].id,
+                      user_id=users[(i * 7) % total].id)
+               for i in range(total)]
+    return {"{}.{}".format(obj.__class__.__name__, obj.id):
+            obj.to_dict(save_fs=1)
+            for objs in [states, cities, users, places, reviews]
+            for obj in objs}
+
+
+def used():
+    """returns the bytes currently traced"""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main(total):
+    """reloads a generated file and reports bytes per object"""
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, "file.json")
+    json_dict = dataset(total)
+    snapshot.dump(path, json.dumps(json_dict), fsync=False)
+    count = len(json_dict)
+    del json_dict
+    FileStorage._FileStorage__objects.clear()
+    storage = FileStorage()
+    storage._FileStorage__file_path = path
+    tracemalloc.start()
+    start = used()
+    storage.reload()
+    loaded = used()
+    storage.save()
+    saved = used()
+    tracemalloc.stop()
+    print("objects: {}".format(count))
+    print("after reload: {:.0f} bytes/object".format(
+        (loaded - start) / count))
+    print("after save (with the encoded JSON cache): {:.0f} bytes/object"
+          .format((saved - start) / count))
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Saves from several worker processes at once and counts the lost writes
+
+Usage: python3 -m benchmarks.multiprocess_writes [workers] [saves per worker]
+
+Set HBNB_FILE_MULTIPROCESS=1 to pull and lock between saves, leave it unset
+to see how many writes plain FileStorage loses.
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from models import storage
+from models.engine.generation import Generation
+from models.engine.journal import Journal
+from models.state import State
+
+
+def worker(saves):
+    """creates and saves one state at a time, pulling between saves"""
+    for i in range(saves):
+        storage.new(State(name="State {} {}".format(os.getpid(), i)))
+        storage.save()
+        storage.close()
+
+
+def main(workers, saves):
+    """runs the workers on one file and checks every state was kept"""
+    for obj in list(storage.all().values()):
+        storage.delete(obj)
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, "file.json")
+    storage._FileStorage__file_path = path
+    if storage._FileStorage__shared:
+        storage._FileStorage__shared = Generation(path)
+    if storage._FileStorage__journal:
+        storage._FileStorage__journal = Journal(path)
+    storage.save()
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=worker, args=(saves,))
+             for n in range(workers)]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    storage.close()
+    stored = storage.count(State)
+    print("workers: {}, saves: {}".format(workers, workers * saves))
+    print("elapsed: {:.2f} s, {:.0f} saves/s".format(
+        elapsed, workers * saves / elapsed))
+    print("stored: {}, lost: {}".format(stored, workers * saves - stored))
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 200)
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+Times GET /api/v1/users as one list and as pages of ?limit= users
+
+Usage: python3 -m benchmarks.pagination [users] [page size]
+"""
+
+import sys
+import time
+from api.v1.app import app
+from models import storage
+from models.user import User
+
+
+def timed(client, url):
+    """returns the JSON body of GET url and its latency in ms"""
+    start = time.perf_counter()
+    body = client.get(url).get_json()
+    return body, (time.perf_counter() - start) * 1000
+
+
+def main(users, size):
+    """adds users and times the full list, the first and a later page"""
+    objs = [User(email="u{}@hbnb.io".format(i), password="pwd")
+            for i in range(users)]
+    for user in objs:
+        storage.new(user)
+    client = app.test_client()
+    body, ms = timed(client, "/api/v1/users")
+    print("full list: {} users {:>10.1f} ms".format(len(body), ms))
+    url = "/api/v1/users?limit={}".format(size)
+    body, ms = timed(client, url)
+    print("first page: {} users {:>9.1f} ms (builds the view)".format(
+        len(body["results"]), ms))
+    body, ms = timed(client, url + "&after=" + body["next"])
+    print("second page: {} users {:>8.1f} ms".format(
+        len(body["results"]), ms))
+    for user in objs:
+        storage.delete(user)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 100))
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+Measures FileStorage.reload() throughput in objects per second, building
+the objects with BaseModel.from_dict() and with the keyword constructor
+
+Usage: python3 -m benchmarks.reload [objects per class]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from unittest import mock
+from models.base_model import BaseModel
+from models.city import City
+from models.engine import snapshot
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+def keyword_constructor(cls, data):
+    """builds an instance the way reload() did before from_dict()"""
+    return cls(**data)
+
+
+def timed_reload(path):
+    """returns the objects per second of one reload() of path"""
+    FileStorage._FileStorage__objects.clear()
+    storage = FileStorage()
+    storage._FileStorage__file_path = path
+    start = time.perf_counter()
+    storage.reload()
+    elapsed = time.perf_counter() - start
+    return storage.count() / elapsed
+
+
+def main(total):
+    """writes total objects of each class and times both reload paths"""
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, "file.json")
+    json_dict = {}
+    for i in range(total):
+        for obj in [State(name="State"), City(name="City", state_id="s"),
+                    User(email="u@hbnb.io", password="pwd"),
+                    Place(name="Place", city_id="c", user_id="u"),
+                    Review(text="Nice", place_id="p", user_id="u")]:
+            key = "{}.{}".format(obj.__class__.__name__, obj.id)
+            json_dict[key] = obj.to_dict(save_fs=1)
+    snapshot.dump(path, json.dumps(json_dict), fsync=False)
+    print("objects: {}".format(len(json_dict)))
+    with mock.patch.object(BaseModel, "from_dict",
+                           classmethod(keyword_constructor)):
+        print("keyword constructor: {:>10.0f} objects/s".format(
+            timed_reload(path)))
+    print("from_dict:           {:>10.0f} objects/s".format(
+        timed_reload(path)))
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
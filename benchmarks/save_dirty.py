@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""
+Measures FileStorage.save() latency against the number of changed objects
+
+Usage: python3 -m benchmarks.save_dirty [number of objects]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from models import storage
+from models.state import State
+
+
+def timed_save():
+    """returns the duration of one storage.save() in milliseconds"""
+    start = time.perf_counter()
+    storage.save()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(total):
+    """fills the storage with total objects and times partial saves"""
+    tmp = tempfile.TemporaryDirectory()
+    storage._FileStorage__file_path = os.path.join(tmp.name, "file.json")
+    states = []
+    for i in range(total):
+        state = State(name="State {}".format(i))
+        storage.new(state)
+        states.append(state)
+    print("objects: {}".format(storage.count()))
+    print("cold save (everything encoded): {:.1f} ms".format(timed_save()))
+    print("{:>10} {:>12}".format("changed", "save (ms)"))
+    for changed in [0, 1, 10, 100, 1000, 10000, total]:
+        for state in states[:changed]:
+            state.name = state.name + "!"
+        print("{:>10} {:>12.1f}".format(changed, timed_save()))
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+"""
+Times FileStorage.search_places() on its inverted indexes against a scan
+of every place, on a generated data set
+
+Usage: python3 -m benchmarks.search_index [places] [amenities]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+from models.amenity import Amenity
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.place import Place
+from models.state import State
+
+
+def fill(storage, places, amenities):
+    """adds places spread over 50 states and 1000 cities, with 5 of the
+    amenities each, and returns the states, cities and amenities"""
+    now = datetime.utcnow().isoformat()
+    rand = random.Random(0)
+
+    def build(cls, i, **attrs):
+        """returns a stored cls instance with a predictable id"""
+        attrs.update(id="{}-{:07d}".format(cls.__name__, i),
+                     created_at=now, updated_at=now)
+        obj = cls.from_dict(attrs)
+        storage.new(obj)
+        return obj
+
+    states = [build(State, i, name="State") for i in range(50)]
+    cities = [build(City, i, name="City", state_id=states[i % 50].id)
+              for i in range(1000)]
+    amenity_ids = [build(Amenity, i, name="Amenity").id
+                   for i in range(amenities)]
+    for i in range(places):
+        build(Place, i, name="Place", city_id=cities[i % 1000].id,
+              user_id="u", amenity_ids=rand.sample(amenity_ids, 5))
+    return states, cities, amenity_ids
+
+
+def scan_places(storage, states=(), cities=(), amenities=(), after=None,
+                limit=None):
+    """returns what search_places() returns, by checking every place"""
+    city_ids = set(cities)
+    for city in storage.all(City).values():
+        if city.state_id in states:
+            city_ids.add(city.id)
+    wanted = set(amenities)
+    if len(storage.get_many(Amenity, wanted)) < len(wanted):
+        return []
+    places = [place for place in storage.all(Place).values()
+              if (not (states or cities) or place.city_id in city_ids) and
+              wanted.issubset(place.amenity_ids)]
+    places.sort(key=lambda place: place.id)
+    if after is not None:
+        places = [place for place in places if place.id > after]
+    return places[:limit]
+
+
+def timed(func, **criteria):
+    """returns the result of func(**criteria) and its latency in ms"""
+    start = time.perf_counter()
+    result = func(**criteria)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(places, amenities):
+    """fills FileStorage and times both searches on a few queries"""
+    storage = FileStorage()
+    for obj in list(storage.all().values()):
+        storage.delete(obj)
+    start = time.perf_counter()
+    states, cities, amenity_ids = fill(storage, places, amenities)
+    print("{} places, {} amenities, indexed in {:.1f} s".format(
+        storage.count(Place), amenities, time.perf_counter() - start))
+    queries = [("1 state", {"states": [states[0].id]}),
+               ("1 state, 1 amenity", {"states": [states[0].id],
+                                       "amenities": amenity_ids[:1]}),
+               ("5 cities, 2 amenities", {"cities": [c.id for c in
+                                                     cities[:5]],
+                                          "amenities": amenity_ids[:2]}),
+               ("2 amenities", {"amenities": amenity_ids[:2]}),
+               ("1 amenity, page of 50", {"amenities": amenity_ids[:1],
+                                          "limit": 50})]
+    print("{:<24} {:>8} {:>12} {:>12}".format("query", "places",
+                                              "scan ms", "index ms"))
+    for label, criteria in queries:
+        scanned, scan_ms = timed(lambda **c: scan_places(storage, **c),
+                                 **criteria)
+        found, index_ms = timed(storage.search_places, **criteria)
+        if found != scanned:
+            print("{}: results differ".format(label))
+            return 1
+        print("{:<24} {:>8} {:>12.1f} {:>12.1f}".format(
+            label, len(found), scan_ms, index_ms))
+    for obj in list(storage.all().values()):
+        storage.delete(obj)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 100))
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+Compares encoding a large list of users the way the views used to, with
+to_dict() and the json module, against to_dict(format_dates=False) and the
+storage serializer
+
+Usage: python3 -m benchmarks.serializer [users]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from api.v1.app import app
+from models import storage
+from models.engine import serializer
+from models.user import User
+
+
+def timed(func, repeat=5):
+    """returns the best duration of func() in milliseconds"""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(total):
+    """fills the storage with total users and times both encodings"""
+    tmp = tempfile.TemporaryDirectory()
+    storage._FileStorage__file_path = os.path.join(tmp.name, "file.json")
+    for i in range(total):
+        storage.new(User(email="user{}@hbnb.io".format(i), password="pwd",
+                         first_name="Betty", last_name="Holberton"))
+    users = list(storage.all(User).values())
+    client = app.test_client()
+    print("users: {}, serializer backend: {}".format(total,
+                                                     serializer.backend))
+    row = "{:<38}{:>8.1f} ms"
+    print(row.format("to_dict() + json.dumps", timed(
+        lambda: json.dumps([u.to_dict() for u in users]))))
+    print(row.format("to_dict(format_dates=False) + dumpb", timed(
+        lambda: serializer.dumpb([u.to_dict(format_dates=False)
+                                  for u in users]))))
+    print(row.format("GET /api/v1/users", timed(
+        lambda: client.get("/api/v1/users"))))
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""
+Compares reload() of one FileStorage file with reload() of per-class shards
+
+Usage: python3 -m benchmarks.sharded_reload [objects per class]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from unittest import mock
+from models.amenity import Amenity
+from models.city import City
+from models.engine import file_storage
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+
+def build(path, shards):
+    """returns a FileStorage reading path, sharded or not"""
+    with mock.patch.dict(os.environ, {"HBNB_FILE_SHARDS": shards}):
+        storage = file_storage.FileStorage()
+    storage._FileStorage__file_path = path
+    return storage
+
+
+def timed_reload(path, shards):
+    """returns the seconds one reload() takes"""
+    storage = build(path, shards)
+    start = time.perf_counter()
+    storage.reload()
+    return time.perf_counter() - start
+
+
+def main(per_class):
+    """writes per_class objects of every class both ways and reloads them"""
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, "file.json")
+    storage = build(path, "1")
+    objs = [cls(name="{} {}".format(cls.__name__, i))
+            for cls in [Amenity, City, Place, Review, State, User]
+            for i in range(per_class)]
+    for obj in objs:
+        storage.new(obj)
+    storage.save()
+    build(path, "0").save()
+    print("objects: {}".format(storage.count()))
+    print("one file: {:.2f} s".format(timed_reload(path, "0")))
+    print("shards: {:.2f} s".format(timed_reload(path, "1")))
+    for obj in objs:
+        storage.delete(obj)
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
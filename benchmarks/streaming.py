@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Peak memory and latency of GET /api/v1/users built as one list and streamed
+as a JSON array or as NDJSON, measured with tracemalloc
+
+Usage: python3 -m benchmarks.streaming [users]
+"""
+
+import sys
+import time
+import tracemalloc
+from flask import jsonify
+from api.v1.app import app
+from models import storage
+from models.user import User
+
+
+def measure(fetch):
+    """returns the body size, peak traced memory in MB and latency in ms
+    of fetch()"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = fetch()
+    ms = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return size, peak, ms
+
+
+def listed():
+    """builds the list response the endpoint used to return"""
+    with app.test_request_context():
+        users = [user.to_dict(format_dates=False)
+                 for user in storage.all(User).values()]
+        return len(jsonify(users).get_data())
+
+
+def streamed(client, accept):
+    """reads the streamed response chunk by chunk"""
+    response = client.get("/api/v1/users", headers={"Accept": accept},
+                          buffered=False)
+    size = sum(len(chunk) for chunk in response.response)
+    response.close()
+    return size
+
+
+def main(users):
+    """adds users and measures the three ways of returning them"""
+    objs = [User(email="u{}@hbnb.io".format(i), password="pwd")
+            for i in range(users)]
+    for user in objs:
+        storage.new(user)
+    client = app.test_client()
+    for name, fetch in [
+            ("list", listed),
+            ("json stream", lambda: streamed(client, "application/json")),
+            ("ndjson stream", lambda: streamed(client,
+                                               "application/x-ndjson"))]:
+        size, peak, ms = measure(fetch)
+        print("{:<14} {:>7.1f} MB body {:>7.1f} MB peak {:>8.1f} ms".format(
+            name, size / 1e6, peak, ms))
+    for user in objs:
+        storage.delete(user)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -5,14 +5,14 @@ Contains class BaseModel
 
 from datetime import datetime
 import models
+from models.engine.serializer import time
 from os import getenv
 import sqlalchemy
+import sys
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
 
-time = "%Y-%m-%dT%H:%M:%S.%f"
-
 if models.storage_t == "db":
     Base = declarative_base()
 else:
@@ -35,11 +35,15 @@ class BaseModel:
                 if key != "__class__":
                     setattr(self, key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
-                self.created_at = datetime.strptime(kwargs["created_at"], time)
+                self.created_at = datetime.fromisoformat(kwargs["created_at"])
             else:
                 self.created_at = datetime.utcnow()
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(kwargs["updated_at"], time)
+                if kwargs["updated_at"] == kwargs.get("created_at"):
+                    self.updated_at = self.created_at
+                else:
+                    self.updated_at = datetime.fromisoformat(
+                        kwargs["updated_at"])
             else:
                 self.updated_at = datetime.utcnow()
             if kwargs.get("id", None) is None:
@@ -49,6 +53,35 @@ class BaseModel:
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
 
+    @classmethod
+    def from_dict(cls, data):
+        """builds an instance from a stored to_dict() without running the
+        attribute hooks, so stored values such as password hashes are kept"""
+        if models.storage_t == "db":
+            return cls(**data)
+        obj = cls.__new__(cls)
+        dates = {}
+        for key, value in data.items():
+            if key == "__class__":
+                continue
+            if key in ("created_at", "updated_at") and type(value) is str:
+                if value not in dates:
+                    dates[value] = datetime.fromisoformat(value)
+                value = dates[value]
+            elif type(value) is str and (key == "id" or key.endswith("_id")):
+                value = sys.intern(value)
+            object.__setattr__(obj, key, value)
+        return obj
+
+    if models.storage_t != "db":
+        def __setattr__(self, name, value):
+            """sets an attribute and reports the write to the storage,
+            interning ids so that foreign keys share their parent's string"""
+            if type(value) is str and (name == "id" or name.endswith("_id")):
+                value = sys.intern(value)
+            super().__setattr__(name, value)
+            models.storage.touch(self, name)
+
     def __str__(self):
         """String representation of the BaseModel class"""
         return "[{:s}] ({:s}) {}".format(self.__class__.__name__, self.id,
@@ -60,13 +93,14 @@ class BaseModel:
         models.storage.new(self)
         models.storage.save()
 
-    def to_dict(self, save_fs=None):
-        """returns a dictionary containing all keys/values of the instance"""
+    def to_dict(self, save_fs=None, format_dates=True):
+        """returns a dictionary containing all keys/values of the instance,
+        with datetimes left as is for the serializer if not format_dates"""
         new_dict = self.__dict__.copy()
-        if "created_at" in new_dict:
+        if format_dates and "created_at" in new_dict:
             new_dict["created_at"] = new_dict["created_at"].strftime(time)
 
-        if "updated_at" in new_dict:
+        if format_dates and "updated_at" in new_dict:
             new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
 
         new_dict["__class__"] = self.__class__.__name__
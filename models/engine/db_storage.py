@@ -3,6 +3,8 @@
 Contains the class DBStorage
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import models
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
@@ -13,12 +15,72 @@ from models.state import State
 from models.user import User
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exc, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy import orm
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.pool import QueuePool
+import threading
+import time
 
 classes = {"Amenity": Amenity, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
+pool_options = {"pool_size": ("HBNB_MYSQL_POOL_SIZE", int),
+                "max_overflow": ("HBNB_MYSQL_MAX_OVERFLOW", int),
+                "pool_timeout": ("HBNB_MYSQL_POOL_TIMEOUT", float),
+                "pool_recycle": ("HBNB_MYSQL_POOL_RECYCLE", int)}
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool that records how long checkouts wait for a connection
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Instantiate a MeteredQueuePool with empty counters"""
+        super().__init__(*args, **kwargs)
+        self.__lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak = 0
+
+    def connect(self):
+        """returns a connection from the pool, timing the wait for it"""
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            with self.__lock:
+                self.timeouts += 1
+                self.__waited(time.perf_counter() - start)
+            raise
+        with self.__lock:
+            self.checkouts += 1
+            self.__waited(time.perf_counter() - start)
+            self.peak = max(self.peak, self.checkedout())
+        return conn
+
+    def __waited(self, elapsed):
+        """adds elapsed seconds to the wait counters"""
+        self.wait_total += elapsed
+        self.wait_max = max(self.wait_max, elapsed)
+
+    def metrics(self):
+        """returns the pool usage and checkout wait counters"""
+        with self.__lock:
+            return {"pool_size": self.size(),
+                    "checked_out": self.checkedout(),
+                    "overflow": max(self.overflow(), 0),
+                    "peak_checked_out": self.peak,
+                    "checkouts": self.checkouts,
+                    "timeouts": self.timeouts,
+                    "wait_ms_total": round(self.wait_total * 1000, 3),
+                    "wait_ms_max": round(self.wait_max * 1000, 3)}
+
 
 class DBStorage:
     """
@@ -26,6 +88,7 @@ class DBStorage:
     """
     __engine = None
     __session = None
+    __factory = None
 
     def __init__(self):
         """Instantiate a DBStorage object"""
@@ -34,23 +97,36 @@ class DBStorage:
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
         HBNB_ENV = getenv('HBNB_ENV')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
-                                      format(HBNB_MYSQL_USER,
-                                             HBNB_MYSQL_PWD,
-                                             HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+        url = getenv('HBNB_MYSQL_URL') or \
+            'mysql+mysqldb://{}:{}@{}/{}'.format(HBNB_MYSQL_USER,
+                                                 HBNB_MYSQL_PWD,
+                                                 HBNB_MYSQL_HOST,
+                                                 HBNB_MYSQL_DB)
+        options = {}
+        url = make_url(url)
+        if url.get_backend_name() != "sqlite" or \
+                url.database not in (None, "", ":memory:"):
+            options["poolclass"] = MeteredQueuePool
+            for option, (name, kind) in pool_options.items():
+                if getenv(name):
+                    options[option] = kind(getenv(name))
+        options["pool_pre_ping"] = getenv('HBNB_MYSQL_POOL_PRE_PING') == "1"
+        self.__engine = create_engine(url, **options)
+        self.__load_workers = int(getenv('HBNB_MYSQL_LOAD_WORKERS') or 1)
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
-        """query on the current database session"""
+    def all(self, cls=None, load=None):
+        """query on the current database session, eager loading the
+        relationship paths in load, such as ["cities.places"]"""
         new_dict = {}
         if cls:
-            objs = self.__session.query(cls).all()
+            if isinstance(cls, str):
+                cls = classes[cls]
+            objs = self.__session.query(cls).options(
+                *self._options(cls, load)).all()
         else:
-            objs = []
-            for clss in classes.values():
-                objs += self.__session.query(clss).all()
+            objs = self._load_all()
         for obj in objs:
             key = "{}.{}".format(obj.__class__.__name__, obj.id)
             new_dict[key] = obj
@@ -72,24 +148,225 @@ class DBStorage:
     def reload(self):
         """reloads data from the database"""
         Base.metadata.create_all(self.__engine)
+        self.migrate()
         sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
         Session = scoped_session(sess_factory)
+        self.__factory = sess_factory
         self.__session = Session
 
+    def migrate(self):
+        """creates the declared indexes missing from existing tables, which
+        create_all() leaves alone, and returns their names"""
+        inspector = sqlalchemy.inspect(self.__engine)
+        created = []
+        for table in Base.metadata.sorted_tables:
+            existing = {index["name"]
+                        for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                if index.name not in existing:
+                    index.create(self.__engine)
+                    created.append(index.name)
+        return created
+
+    def explain(self, query):
+        """returns the lines of the database plan for a query"""
+        statement = getattr(query, "statement", query)
+        sql = str(statement.compile(self.__engine,
+                                    compile_kwargs={"literal_binds": True}))
+        if self.__engine.dialect.name == "sqlite":
+            sql = "EXPLAIN QUERY PLAN " + sql
+        else:
+            sql = "EXPLAIN " + sql
+        rows = self.__session.execute(sqlalchemy.text(sql)).fetchall()
+        return [" ".join(str(value) for value in row) for row in rows]
+
+    @contextmanager
+    def count_statements(self):
+        """yields a list collecting the SQL statements sent to the database
+        for the duration of the with block"""
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            """records each statement sent to the database"""
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.__engine, "before_cursor_execute",
+                                listener)
+        try:
+            yield statements
+        finally:
+            sqlalchemy.event.remove(self.__engine, "before_cursor_execute",
+                                    listener)
+
     def close(self):
         """call remove() method on the private session attribute"""
         self.__session.remove()
 
-    def get(self, cls, id):
-        """Retrieve one object"""
-        return self.__session.query(cls).filter_by(id=id).first()
+    def get(self, cls, id, load=None):
+        """Retrieve one object, from the session identity map if it is
+        already loaded, or else with the relationship paths in load"""
+        return self.__session.get(cls, id, options=self._options(cls, load))
+
+    def get_many(self, cls, ids, load=None):
+        """returns the objects of cls with the given ids in their order,
+        skipping unknown ids; those not in the session, or all of them with
+        relationship paths to eager load, are loaded in one IN query"""
+        session = self.__session()
+        found = {}
+        missing = []
+        for id in ids:
+            obj = session.identity_map.get(identity_key(cls, id))
+            if obj is not None and not load:
+                found[id] = obj
+            else:
+                missing.append(id)
+        if missing:
+            query = session.query(cls).options(*self._options(cls, load))
+            for obj in query.filter(cls.id.in_(missing)):
+                found[obj.id] = obj
+        return [found[id] for id in ids if id in found]
+
+    def related(self, cls, attr, value):
+        """returns the objects of cls whose foreign key attr equals value"""
+        return self.__session.query(cls).filter(
+            getattr(cls, attr) == value).all()
+
+    def metrics(self):
+        """returns the connection pool usage and checkout wait times"""
+        pool = self.__engine.pool
+        if isinstance(pool, MeteredQueuePool):
+            return pool.metrics()
+        return {"pool": pool.status()}
 
     def count(self, cls=None):
         """Count the number of objects in storage"""
         if cls:
             return self.__session.query(cls).count()
         else:
-            count = 0
-            for clss in classes.values():
-                count += self.__session.query(clss).count()
-            return count
+            return sum(self.counts().values())
+
+    def counts(self, cls_list=None):
+        """returns {class name: number of objects} for the classes in
+        cls_list, or every class, in one statement"""
+        if cls_list is None:
+            cls_list = list(classes.values())
+        row = self.__session.execute(select(*[
+            select(func.count()).select_from(cls).scalar_subquery()
+            for cls in cls_list])).one()
+        return {cls.__name__: n for cls, n in zip(cls_list, row)}
+
+    def page(self, cls, after=None, limit=None, order_by="id", where=None):
+        """returns up to limit objects of cls whose columns equal the where
+        {attr: value} pairs, ordered by order_by then id, following the
+        object whose id is after, reading an index from the cursor on"""
+        query = self.__session.query(cls)
+        for attr, value in (where or {}).items():
+            query = query.filter(getattr(cls, attr) == value)
+        column = getattr(cls, order_by)
+        if after is not None and order_by == "id":
+            query = query.filter(cls.id > after)
+        elif after is not None:
+            value = select(column).where(cls.id == after).scalar_subquery()
+            query = query.filter(sqlalchemy.or_(
+                column > value,
+                sqlalchemy.and_(column == value, cls.id > after)))
+        query = query.order_by(column, cls.id) if order_by != "id" \
+            else query.order_by(cls.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def stream(self, cls, where=None, batch=1000):
+        """yields the objects of cls whose columns equal the where
+        {attr: value} pairs, batch rows at a time"""
+        query = select(cls)
+        for attr, value in (where or {}).items():
+            query = query.where(getattr(cls, attr) == value)
+        return self._stream(query, batch)
+
+    def _stream(self, statement, batch=1000):
+        """yields the objects selected by statement through a server-side
+        cursor, in a session of its own that forgets each batch once it has
+        been yielded, so memory does not grow with the result"""
+        with self.__factory() as session:
+            result = session.execute(
+                statement.execution_options(yield_per=batch))
+            for objs in result.scalars().partitions():
+                yield from objs
+                for obj in objs:
+                    session.expunge(obj)
+
+    def search_places(self, states=(), cities=(), amenities=(), after=None,
+                      limit=None, stream=False):
+        """returns the places in the given states or cities, or anywhere
+        without either, that have every given amenity, ordered by id from
+        after on, in one query; with stream, an iterator reading them as
+        stream() does"""
+        query = self.__session.query(Place)
+        if states or cities:
+            query = query.join(City, Place.city_id == City.id).filter(
+                sqlalchemy.or_(City.state_id.in_(states),
+                               City.id.in_(cities)))
+        if amenities:
+            link = Place.amenities.property.secondary
+            query = query.filter(Place.id.in_(
+                select(link.c.place_id).
+                where(link.c.amenity_id.in_(amenities)).
+                group_by(link.c.place_id).
+                having(func.count(link.c.amenity_id.distinct()) ==
+                       len(set(amenities)))))
+        if after is not None:
+            query = query.filter(Place.id > after)
+        query = query.order_by(Place.id)
+        if limit is not None:
+            query = query.limit(limit)
+        if stream:
+            return self._stream(query.statement)
+        return query.all()
+
+    def _options(self, cls, load):
+        """returns the loader options for the relationship paths in load:
+        selectin loading for collections, joined loading otherwise"""
+        options = []
+        for path in load or ():
+            option = None
+            owner = cls
+            for name in path.split("."):
+                attr = getattr(owner, name)
+                prop = attr.property
+                strategy = "selectinload" if prop.uselist else "joinedload"
+                option = getattr(option or orm, strategy)(attr)
+                owner = prop.mapper.class_
+            options.append(option)
+        return options
+
+    def _load(self, cls):
+        """returns the objects of cls, loaded in a session of its own"""
+        with self.__factory() as session:
+            return session.query(cls).all()
+
+    def _load_all(self):
+        """returns the objects of every class, loaded by up to
+        HBNB_MYSQL_LOAD_WORKERS pooled connections at once unless the
+        session has unflushed changes"""
+        session = self.__session
+        pool = self.__engine.pool
+        workers = 1
+        if isinstance(pool, MeteredQueuePool):
+            workers = min(len(classes), pool.size(), self.__load_workers)
+        if workers < 2 or session.new or session.dirty or session.deleted:
+            return [obj for clss in classes.values()
+                    for obj in session.query(clss).all()]
+        with ThreadPoolExecutor(workers) as executor:
+            results = list(executor.map(self._load, classes.values()))
+        session = session()
+        identities = session.identity_map
+        objs = []
+        for obj in (obj for result in results for obj in result):
+            key = sqlalchemy.inspect(obj).identity_key
+            current = identities.get(key)
+            if current is None:
+                session.add(obj)
+                current = obj
+            objs.append(current)
+        return objs
@@ -3,18 +3,45 @@
 Contains the FileStorage class
 """
 
+import bisect
+import heapq
 import json
+import os
+from types import MappingProxyType
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.flusher import Flusher
+from models.engine.generation import Generation
+from models.engine.journal import Journal
+from models.engine.rwlock import RWLock
+from models.engine.scanner import scan
+from models.engine import serializer
+from models.engine import snapshot
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from os import getenv
+import threading
 
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
+fk_indexes = {"City": ("state_id",),
+              "Place": ("city_id", "user_id", "amenity_ids"),
+              "Review": ("place_id", "user_id")}
+
+
+def load_shard(path):
+    """returns the objects stored in one shard file, keyed by <class>.id"""
+    try:
+        json_dict = snapshot.load(path)
+    except FileNotFoundError:
+        return {}
+    return {key: classes[value['__class__']].from_dict(value)
+            for key, value in json_dict.items()}
+
 
 class FileStorage:
     """
@@ -23,62 +50,656 @@ class FileStorage:
 
     __file_path = "file.json"
     __objects = {}
+    __buckets = {}
+    __fk_index = {}
+    __fk_values = {}
+    __dirty = set()
+    __deleted = set()
+    __fragments = {}
+    __lazy = {}
+    __lazy_file = None
+    __views = {}
+    __generation = 0
+    __requested = 0
+    __flushed = 0
+    __lock = RWLock()
+    __save_lock = threading.Lock()
+    __mutex = threading.Lock()
 
-    def all(self, cls=None):
-        """returns the dictionary __objects"""
+    def __init__(self):
+        """Instantiate a FileStorage object"""
+        self.__stamp = None
+        self.__seen = -1
+        self.__journal = None
+        if getenv("HBNB_FILE_JOURNAL") == "1":
+            max_size = int(getenv("HBNB_FILE_JOURNAL_MAX", 1 << 20))
+            self.__journal = Journal(self.__file_path, max_size)
+        self.__sharded = getenv("HBNB_FILE_SHARDS") == "1" and \
+            self.__journal is None
+        self.__streaming = getenv("HBNB_FILE_LAZY") == "1" and \
+            self.__journal is None and not self.__sharded
+        self.__shared = None
+        if getenv("HBNB_FILE_MULTIPROCESS") == "1":
+            self.__shared = Generation(self.__file_path)
+        durability = getenv("HBNB_FILE_DURABILITY", "sync")
+        self.__fsync = durability != "interval"
+        if self.__journal:
+            self.__journal.fsync = self.__fsync
+        self.__flusher = None
+        if durability == "interval":
+            interval = int(getenv("HBNB_FILE_FLUSH_MS", 100)) / 1000
+            self.__flusher = Flusher(self._flush, interval)
+        elif durability == "fsync-group":
+            self.__flusher = Flusher(self._flush, wait=True)
+
+    def all(self, cls=None, load=None):
+        """returns the dictionary __objects, or a view of one class bucket;
+        load is ignored, relationship getters use the foreign-key indexes"""
         if cls:
+            names = self._bucket_names(cls)
+            self._materialize(names)
             new_dict = {}
-            for key, value in self.__objects.items():
-                if isinstance(value, cls):
-                    new_dict[key] = value
-            return new_dict
+            with self.__lock.read():
+                for name in names:
+                    new_dict.update(self.__buckets.get(name, {}))
+            return MappingProxyType(new_dict)
+        self._materialize()
         return self.__objects
 
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         key = "{}.{}".format(obj.__class__.__name__, obj.id)
-        self.__objects[key] = obj
+        with self.__lock.write():
+            self.__objects[key] = obj
+            self._index(key, obj)
+            self.__lazy.get(obj.__class__.__name__, {}).pop(key, None)
+            with self.__mutex:
+                self.__dirty.add(key)
+                self.__deleted.discard(key)
+
+    def touch(self, obj, attr=None):
+        """flags obj as modified since the last save() if it is stored"""
+        obj_id = getattr(obj, "id", None)
+        if obj_id is None:
+            return
+        name = obj.__class__.__name__
+        key = "{}.{}".format(name, obj_id)
+        if self.__objects.get(key) is not obj:
+            return
+        self.__views.pop(name, None)
+        with self.__mutex:
+            self.__dirty.add(key)
+        if attr in fk_indexes.get(name, ()):
+            with self.__lock.write():
+                self._index(key, obj)
 
     def save(self):
         """serializes __objects to the JSON file (path: __file_path)"""
-        json_dict = {}
-        for key, value in self.__objects.items():
-            json_dict[key] = value.to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_dict, f)
+        if self.__flusher:
+            self.__flusher.request()
+        else:
+            self._flush()
+
+    def _flush(self):
+        """writes the changes made since the last flush, unless a flush
+        that started after this call already wrote them"""
+        with self.__mutex:
+            FileStorage.__requested += 1
+            ticket = FileStorage.__requested
+        with self.__save_lock:
+            if FileStorage.__flushed >= ticket:
+                return
+            with self.__mutex:
+                upto = FileStorage.__requested
+                dirty = set(self.__dirty)
+                deleted = set(self.__deleted)
+                self.__dirty.clear()
+                self.__deleted.clear()
+            try:
+                if self.__shared:
+                    with self.__shared.locked():
+                        self._pull(dirty | deleted)
+                        self._save(dirty, deleted)
+                        self.__shared.push(self._changes(dirty, deleted))
+                else:
+                    self._save(dirty, deleted)
+            except Exception:
+                with self.__mutex:
+                    self.__dirty.update(dirty)
+                    self.__deleted.update(deleted)
+                raise
+            FileStorage.__flushed = upto
+            self._synced()
+
+    def _save(self, dirty, deleted):
+        """writes the objects, re-encoding the dirty ones"""
+        if self.__journal:
+            with self.__lock.read():
+                records = [(key, None) for key in deleted]
+                for key in dirty:
+                    obj = self.__objects.get(key)
+                    if obj is not None:
+                        records.append((key, obj.to_dict(save_fs=1)))
+            self.__journal.append(records)
+            return
+        if self.__sharded:
+            shards = {}
+            with self.__lock.read():
+                names = {key.split(".")[0] for key in dirty
+                         if key in self.__objects}
+                names.update(key.split(".")[0] for key in deleted)
+                for name in names:
+                    shards[name] = self._fragments(
+                        self.__buckets.get(name, {}), dirty)
+            for name, parts in shards.items():
+                self._write(self._shard_path(name), parts)
+            return
+        if self.__streaming or self.__lazy:
+            with self.__lock.write():
+                self._save_lazy(dirty, deleted)
+            return
+        with self.__lock.read():
+            parts = self._fragments(self.__objects, dirty)
+        self._write(self.__file_path, parts)
+
+    def _save_lazy(self, dirty, deleted):
+        """writes the file with the records not built yet copied from the
+        old one, and moves their offsets to the new one; the caller holds
+        the write lock, so no reader seeks old offsets in the new file"""
+        parts = []
+        lazy = {}
+        pos = 1
+        for name, key, prefix, raw in self._raw_records():
+            if key in deleted:
+                continue
+            lazy.setdefault(name, {})[key] = (pos + len(prefix), len(raw))
+            parts.append(prefix + raw)
+            pos += len(prefix) + len(raw) + 2
+        parts += self._fragments(self.__objects, dirty)
+        self._write(self.__file_path, parts)
+        self.__lazy.clear()
+        self.__lazy.update(lazy)
+        FileStorage.__lazy_file = self._identity(os.stat(self.__file_path))
 
     def reload(self):
         """deserializes the JSON file to __objects"""
+        if self.__shared:
+            with self.__shared.locked(exclusive=False):
+                self._reload()
+                self.__shared.skip()
+            return
+        self._reload()
+
+    def _reload(self):
+        """reads every stored object into __objects"""
         try:
-            with open(self.__file_path, 'r') as f:
-                json_dict = json.load(f)
-            for key, value in json_dict.items():
-                class_name = value['__class__']
-                cls = classes[class_name]
-                self.__objects[key] = cls(**value)
-        except Exception as e:
+            stamp = self._stamp()
+            if self.__streaming:
+                with self.__lock.write():
+                    self._scan()
+                self._synced(stamp)
+                return
+            if self.__sharded:
+                for objs in self._load_shards():
+                    with self.__lock.write():
+                        for key, obj in objs.items():
+                            self.__objects[key] = obj
+                            self._index(key, obj)
+                    with self.__mutex:
+                        self.__dirty.difference_update(objs)
+                self._synced(stamp)
+                return
+            json_dict = self._read()
+            with self.__lock.write():
+                for key, value in json_dict.items():
+                    self._load(key, value)
+            with self.__mutex:
+                self.__dirty.difference_update(json_dict)
+            self._synced(stamp)
+        except FileNotFoundError:
             pass
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj:
             key = "{}.{}".format(obj.__class__.__name__, obj.id)
-            if key in self.__objects:
+            with self.__lock.write():
+                if key not in self.__objects:
+                    return
                 del self.__objects[key]
+                self._unindex(key)
+                self.__fragments.pop(key, None)
+                with self.__mutex:
+                    self.__dirty.discard(key)
+                    self.__deleted.add(key)
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
-        self.reload()
+        """applies the changes made to the JSON file since the last sync"""
+        with self.__save_lock:
+            if self.__shared:
+                with self.__shared.locked(exclusive=False):
+                    self._pull()
+                return
+            stamp = self._stamp()
+            if stamp == self.__stamp and \
+                    self.__seen == FileStorage.__generation:
+                return
+            self._resync(stamp)
 
-    def get(self, cls, id):
+    def _resync(self, stamp):
+        """rebuilds the objects that differ from the stored ones, keeping
+        those with changes not flushed yet"""
+        if self.__streaming:
+            with self.__lock.write():
+                try:
+                    self._scan(forget=True)
+                except Exception as e:
+                    return
+            self._synced(stamp)
+            return
+        try:
+            json_dict = self._read()
+        except Exception as e:
+            return
+        with self.__lock.write():
+            for key, value in json_dict.items():
+                if key in self.__dirty or key in self.__deleted:
+                    continue
+                obj = self.__objects.get(key)
+                if obj is None or obj.to_dict(save_fs=1) != value:
+                    self._load(key, value)
+            self._forget(key for key in self.__objects
+                         if key not in json_dict and key not in self.__dirty)
+        self._synced(stamp)
+
+    def _pull(self, pending=()):
+        """applies the records other processes saved since the last pull,
+        keeping the local changes to the keys in pending"""
+        if not self.__shared.changed():
+            return
+        changes = self.__shared.pull()
+        if changes is None:
+            self._resync(self._stamp())
+            self.__shared.skip()
+            return
+        with self.__lock.write():
+            for key, value in changes.items():
+                if key in pending or key in self.__dirty or \
+                        key in self.__deleted:
+                    continue
+                self.__lazy.get(key.split(".")[0], {}).pop(key, None)
+                obj = self.__objects.get(key)
+                if value is None:
+                    if obj is not None:
+                        self._forget([key])
+                elif obj is None or obj.to_dict(save_fs=1) != value:
+                    self._load(key, value)
+            if self.__streaming:
+                self._scan()
+
+    def get(self, cls, id, load=None):
         """Retrieve one object"""
         key = "{}.{}".format(cls.__name__, id)
-        return self.__objects.get(key, None)
+        if key in self.__lazy.get(cls.__name__, {}):
+            with self.__lock.write():
+                record = self.__lazy.get(cls.__name__, {}).pop(key, None)
+                if record:
+                    self._build({key: record})
+        with self.__lock.read():
+            return self.__objects.get(key, None)
+
+    def get_many(self, cls, ids, load=None):
+        """returns the objects of cls with the given ids in their order,
+        skipping unknown ids, in one pass over its bucket"""
+        name = cls.__name__
+        keys = ["{}.{}".format(name, id) for id in ids]
+        lazy = self.__lazy.get(name, {})
+        if any(key in lazy for key in keys):
+            with self.__lock.write():
+                lazy = self.__lazy.get(name, {})
+                records = {key: lazy.pop(key) for key in keys if key in lazy}
+                if records:
+                    self._build(records)
+        with self.__lock.read():
+            bucket = self.__buckets.get(name, {})
+            return [bucket[key] for key in keys if key in bucket]
+
+    def search_places(self, states=(), cities=(), amenities=(), after=None,
+                      limit=None, stream=False):
+        """returns the places in the given states or cities, or anywhere
+        without either, that have every given amenity, ordered by id from
+        after on; with stream, an iterator over them"""
+        self._materialize(["Amenity", "City", "Place"])
+        with self.__lock.read():
+            index = self.__fk_index
+            matches = []
+            if states or cities:
+                city_ids = set(cities)
+                by_state = index.get(("City", "state_id"), {})
+                for state_id in states:
+                    city_ids.update(city.id for city in
+                                    by_state.get(state_id, {}).values())
+                by_city = index.get(("Place", "city_id"), {})
+                located = {}
+                for city_id in city_ids:
+                    located.update(by_city.get(city_id, {}))
+                matches.append(located)
+            if amenities:
+                known = self.__buckets.get("Amenity", {})
+                by_amenity = index.get(("Place", "amenity_ids"), {})
+                for amenity_id in set(amenities):
+                    if "Amenity.{}".format(amenity_id) not in known:
+                        return iter([]) if stream else []
+                    matches.append(by_amenity.get(amenity_id, {}))
+            places = self.__buckets.get("Place", {})
+            if matches:
+                matches.sort(key=len)
+                keys = set(matches[0]).intersection(*matches[1:])
+            else:
+                keys = places
+            if after is not None:
+                after = "Place.{}".format(after)
+                keys = (key for key in keys if key > after)
+            if limit is None:
+                keys = sorted(keys)
+            else:
+                keys = heapq.nsmallest(limit, keys)
+            places = [places[key] for key in keys]
+        return iter(places) if stream else places
+
+    def stream(self, cls, where=None, batch=1000):
+        """yields the objects of cls whose attributes equal the where
+        {attr: value} pairs, from a snapshot of their bucket; they are held
+        in memory already, so batch is ignored"""
+        names = self._bucket_names(cls)
+        self._materialize(names)
+        with self.__lock.read():
+            objs = [obj for name in names
+                    for obj in self._matching(name, where or {})]
+        return iter(objs)
+
+    def page(self, cls, after=None, limit=None, order_by="id", where=None):
+        """returns up to limit objects of cls whose attributes equal the
+        where {attr: value} pairs, ordered by order_by then id, following
+        the object whose id is after, from a sorted view of the class kept
+        until it changes"""
+        name = cls.__name__
+        self._materialize([name])
+        where = where or {}
+        view_key = (order_by, tuple(sorted(where.items())))
+        with self.__lock.read():
+            bucket = self.__buckets.get(name, {})
+            views = self.__views.setdefault(name, {})
+            view = views.get(view_key)
+            if view is None:
+                view = sorted((getattr(obj, order_by), obj.id)
+                              for obj in self._matching(name, where))
+                if self.__views.get(name) is views:
+                    views[view_key] = view
+            start = 0
+            if after is not None and order_by == "id":
+                start = bisect.bisect_right(view, (after, after))
+            elif after is not None:
+                cursor = bucket.get("{}.{}".format(name, after))
+                if cursor is None:
+                    return []
+                start = bisect.bisect_right(
+                    view, (getattr(cursor, order_by), after))
+            end = None if limit is None else start + limit
+            return [bucket["{}.{}".format(name, id)]
+                    for value, id in view[start:end]]
+
+    def _matching(self, name, where):
+        """returns the objects of the named class whose attributes equal
+        the where {attr: value} pairs, narrowed by a foreign-key index"""
+        objs = self.__buckets.get(name, {})
+        if not where:
+            return list(objs.values())
+        for attr, value in where.items():
+            if attr in fk_indexes.get(name, ()):
+                objs = self.__fk_index.get((name, attr), {}).get(value, {})
+                break
+        return [obj for obj in objs.values()
+                if all(getattr(obj, attr, None) == value
+                       for attr, value in where.items())]
 
     def count(self, cls=None):
         """Count the number of objects in storage"""
-        itm = [obj for obj in self.__objects.values() if isinstance(obj, cls)]
-        if cls:
-            return len(itm)
-        else:
-            return len(self.__objects)
+        with self.__lock.read():
+            if cls:
+                names = self._bucket_names(cls)
+            else:
+                names = set(self.__buckets) | set(self.__lazy)
+            return sum(len(self.__buckets.get(name, {})) +
+                       len(self.__lazy.get(name, {})) for name in names)
+
+    def counts(self, cls_list=None):
+        """returns {class name: number of objects} for the classes in
+        cls_list, or every class, under one lock"""
+        if cls_list is None:
+            cls_list = list(classes.values())
+        with self.__lock.read():
+            return {cls if isinstance(cls, str) else cls.__name__:
+                    self.count(cls) for cls in cls_list}
+
+    def related(self, cls, attr, value):
+        """returns the objects of cls whose foreign key attr equals value,
+        or whose indexed list attr holds it"""
+        name = cls.__name__
+        self._materialize([name])
+        with self.__lock.read():
+            if attr in fk_indexes.get(name, ()):
+                children = self.__fk_index.get((name, attr), {})
+                return list(children.get(value, {}).values())
+            return [obj for obj in self.__buckets.get(name, {}).values()
+                    if getattr(obj, attr, None) == value]
+
+    def _changes(self, dirty, deleted):
+        """returns the {key: dict or None} records written by a save()"""
+        changes = dict.fromkeys(deleted)
+        with self.__lock.read():
+            for key in dirty:
+                obj = self.__objects.get(key)
+                if obj is not None:
+                    changes[key] = obj.to_dict(save_fs=1)
+        return changes
+
+    def _fragments(self, objects, dirty):
+        """returns the "<key>": <JSON> fragments of objects, cached unless
+        their key is in dirty or the object was replaced"""
+        parts = []
+        for key, value in objects.items():
+            cached = self.__fragments.get(key)
+            if cached is None or key in dirty:
+                cached = "{}: {}".format(json.dumps(key), serializer.dumps(
+                    value.to_dict(save_fs=1, format_dates=False)))
+                self.__fragments[key] = cached
+            parts.append(cached)
+        return parts
+
+    def _write(self, path, parts):
+        """atomically replaces path with the fragments in parts as one JSON
+        object"""
+        snapshot.dump(path, "{" + ", ".join(parts) + "}", self.__fsync)
+
+    def _shard_path(self, name):
+        """returns the path of the file holding the objects of class name"""
+        return os.path.join(os.path.dirname(self.__file_path),
+                            name + ".json")
+
+    def _load_shards(self):
+        """returns the objects of every shard, all read before any is
+        applied so that a torn shard leaves storage as it was"""
+        return [load_shard(self._shard_path(name)) for name in classes]
+
+    def _read(self):
+        """returns the stored objects as a dict of dicts"""
+        if self.__journal:
+            return self.__journal.load()
+        if self.__sharded:
+            json_dict = {}
+            for name in classes:
+                try:
+                    json_dict.update(snapshot.load(self._shard_path(name)))
+                except FileNotFoundError:
+                    pass
+            return json_dict
+        return snapshot.load(self.__file_path)
+
+    def _forget(self, keys):
+        """drops the objects stored under keys without logging a delete"""
+        for key in list(keys):
+            self._unindex(key)
+            self.__fragments.pop(key, None)
+            del self.__objects[key]
+
+    def _load(self, key, value):
+        """builds the object stored under key from its dict and indexes it"""
+        cls = classes[value['__class__']]
+        self.__objects[key] = cls.from_dict(value)
+        self._index(key, self.__objects[key])
+
+    def _scan(self, f=None, forget=False):
+        """indexes the byte offset of every stored record not built yet,
+        in the open binary file f or else the storage file, once its footer
+        and closing brace are found; with forget, the built objects without
+        unsaved changes are dropped first, to be read again from the file"""
+        if f is None:
+            with open(self.__file_path, 'rb') as f:
+                return self._scan(f, forget)
+        snapshot.check(f)
+        records = list(scan(f))
+        if forget:
+            self._forget(key for key in self.__objects
+                         if key not in self.__dirty)
+        lazy = {}
+        for key, offset, length in records:
+            if key not in self.__objects and key not in self.__deleted:
+                name = key.split(".")[0]
+                lazy.setdefault(name, {})[key] = (offset, length)
+        self.__lazy.clear()
+        self.__lazy.update(lazy)
+        FileStorage.__lazy_file = self._identity(os.fstat(f.fileno()))
+
+    def _rescan(self, f):
+        """scans the open file f again if it is not the one the offsets
+        were taken from, because another process replaced it; returns True
+        if it did"""
+        if self._identity(os.fstat(f.fileno())) == FileStorage.__lazy_file:
+            return False
+        self._scan(f)
+        return True
+
+    @staticmethod
+    def _identity(st):
+        """returns what tells a version of the file from the next one"""
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _materialize(self, names=None):
+        """builds the lazily indexed records of the named classes"""
+        if not self.__lazy:
+            return
+        with self.__lock.write():
+            for name in list(self.__lazy) if names is None else names:
+                records = self.__lazy.pop(name, None)
+                if records:
+                    self._build(records)
+
+    def _build(self, records):
+        """builds the objects of {key: (offset, length)} file records"""
+        with open(self.__file_path, 'rb') as f:
+            if self._rescan(f):
+                records = {key: self.__lazy[key.split(".")[0]].pop(key)
+                           for key in records
+                           if key in self.__lazy.get(key.split(".")[0], {})}
+            for key, (offset, length) in sorted(records.items(),
+                                                key=lambda r: r[1][0]):
+                f.seek(offset)
+                self._load(key, serializer.loads(f.read(length)))
+                with self.__mutex:
+                    self.__dirty.discard(key)
+
+    def _raw_records(self):
+        """returns (class name, key, prefix, JSON) of records not built yet"""
+        raw_records = []
+        if not self.__lazy:
+            return raw_records
+        with open(self.__file_path, 'rb') as f:
+            self._rescan(f)
+            records = sorted((offset, length, name, key)
+                             for name, bucket in self.__lazy.items()
+                             for key, (offset, length) in bucket.items())
+            for offset, length, name, key in records:
+                f.seek(offset)
+                raw = f.read(length).decode()
+                if not raw.isascii():
+                    raw = json.dumps(json.loads(raw))
+                raw_records.append((name, key, json.dumps(key) + ": ", raw))
+        return raw_records
+
+    def _stamp(self):
+        """returns the mtime, size and inode of the files backing storage"""
+        paths = [self.__file_path]
+        if self.__sharded:
+            paths = [self._shard_path(name) for name in classes]
+        if self.__journal:
+            paths += [self.__journal.compacting_path, self.__journal.path]
+        stamp = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                stamp.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _synced(self, stamp=None):
+        """records the files and generation this storage is in sync with"""
+        if stamp is None:
+            FileStorage.__generation += 1
+            stamp = self._stamp()
+        self.__stamp = stamp
+        self.__seen = FileStorage.__generation
+
+    def _bucket_names(self, cls):
+        """returns the names of the buckets holding instances of cls"""
+        if isinstance(cls, str):
+            return [cls]
+        return [name for name, clss in classes.items()
+                if issubclass(clss, cls)]
+
+    def _index(self, key, obj):
+        """adds obj to its class bucket and foreign-key indexes"""
+        self._unindex(key)
+        self.__fragments.pop(key, None)
+        name = obj.__class__.__name__
+        self.__buckets.setdefault(name, {})[key] = obj
+        attrs = fk_indexes.get(name, ())
+        if not attrs:
+            return
+        values = []
+        for attr in attrs:
+            value = getattr(obj, attr, None)
+            if isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+            index = self.__fk_index.setdefault((name, attr), {})
+            for item in value if isinstance(value, tuple) else (value,):
+                index.setdefault(item, {})[key] = obj
+        self.__fk_values[key] = tuple(values)
+
+    def _unindex(self, key):
+        """removes the object stored under key from the bucket and indexes"""
+        name = key.split(".")[0]
+        self.__buckets.get(name, {}).pop(key, None)
+        self.__views.pop(name, None)
+        values = self.__fk_values.pop(key, None)
+        if not values:
+            return
+        for attr, value in zip(fk_indexes[name], values):
+            index = self.__fk_index.get((name, attr), {})
+            for item in value if isinstance(value, tuple) else (value,):
+                children = index.get(item, {})
+                children.pop(key, None)
+                if not children:
+                    index.pop(item, None)
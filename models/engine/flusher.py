@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Contains the Flusher class
+"""
+
+import atexit
+from concurrent.futures import Future
+import threading
+
+
+class Flusher:
+    """
+    Runs a flush function in a background thread, one call for many requests
+
+    With an interval, requests made within interval seconds of the first
+    one share the next flush and request() returns at once. With wait,
+    request() blocks until a flush that started after it has finished, and
+    raises its error; requests made during a flush share the next one.
+    Requests still pending when the interpreter exits are flushed.
+    """
+
+    def __init__(self, flush, interval=0, wait=False):
+        """Instantiate a Flusher calling flush from its own thread"""
+        self.flush = flush
+        self.interval = interval
+        self.wait = wait
+        self.__cond = threading.Condition()
+        self.__pending = []
+        self.__stopped = False
+        self.__thread = threading.Thread(target=self._run, daemon=True)
+        self.__thread.start()
+        atexit.register(self.stop)
+
+    def request(self):
+        """asks for a flush, waiting for it when the flusher was built so"""
+        future = Future()
+        with self.__cond:
+            if self.__stopped:
+                self.flush()
+                return
+            self.__pending.append(future)
+            self.__cond.notify_all()
+        if self.wait:
+            future.result()
+
+    def stop(self):
+        """flushes the pending requests and stops the thread"""
+        with self.__cond:
+            self.__stopped = True
+            self.__cond.notify_all()
+        self.__thread.join()
+
+    def _run(self):
+        """waits for requests and flushes them in batches until stopped"""
+        while True:
+            with self.__cond:
+                while not self.__pending and not self.__stopped:
+                    self.__cond.wait()
+                if self.interval and not self.__stopped:
+                    self.__cond.wait_for(lambda: self.__stopped,
+                                         self.interval)
+                if not self.__pending:
+                    return
+                batch = self.__pending
+                self.__pending = []
+            try:
+                self.flush()
+            except Exception as e:
+                for future in batch:
+                    future.set_exception(e)
+            else:
+                for future in batch:
+                    future.set_result(None)
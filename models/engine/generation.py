@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Contains the Generation class
+"""
+
+from contextlib import contextmanager
+import fcntl
+import json
+import os
+
+
+class Generation:
+    """
+    Advisory lock and generation counter shared by the processes saving
+    to one storage file
+
+    Every save under the exclusive lock appends one line to the changes
+    log: the new generation number and the records it put or deleted.
+    Other processes read the lines past their own generation, so they only
+    rebuild what changed. Past max_size the log is restarted from a base
+    line, and a process that missed lines must read the whole file again.
+    """
+
+    def __init__(self, snapshot_path, max_size=1 << 20):
+        """Instantiate a Generation for the snapshot at snapshot_path"""
+        self.lock_path = snapshot_path + ".lock"
+        self.path = snapshot_path + ".gen"
+        self.max_size = max_size
+        self.value = 0
+        self.__offset = 0
+        self.__inode = None
+
+    @contextmanager
+    def locked(self, exclusive=True):
+        """holds the advisory file lock for the duration of the with block"""
+        with open(self.lock_path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def changed(self):
+        """returns True if another process saved since the last pull"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return (st.st_ino, st.st_size) != (self.__inode, self.__offset)
+
+    def pull(self):
+        """returns {key: dict or None} saved by the other processes since
+        the last pull, None if the log no longer covers this generation"""
+        changes = {}
+        try:
+            with open(self.path, 'rb') as f:
+                inode = os.fstat(f.fileno()).st_ino
+                if inode != self.__inode:
+                    self.__inode = inode
+                    self.__offset = 0
+                f.seek(self.__offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    record = json.loads(line)
+                    gen = record["gen"]
+                    if record.get("base") and gen > self.value or \
+                            gen > self.value + 1:
+                        return None
+                    if gen == self.value + 1:
+                        changes.update(record["changes"])
+                        self.value = gen
+                    self.__offset += len(line)
+        except FileNotFoundError:
+            pass
+        return changes
+
+    def push(self, changes):
+        """appends the {key: dict or None} changes as the next generation"""
+        self.value += 1
+        line = json.dumps({"gen": self.value, "changes": changes}) + "\n"
+        with open(self.path, 'a') as f:
+            f.write(line)
+            size = f.tell()
+            inode = os.fstat(f.fileno()).st_ino
+        if size >= self.max_size:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps({"gen": self.value - 1, "base": True}))
+                f.write("\n" + line)
+                size = f.tell()
+                inode = os.fstat(f.fileno()).st_ino
+            os.replace(tmp_path, self.path)
+        self.__inode = inode
+        self.__offset = size
+
+    def skip(self):
+        """marks every logged generation as applied, after a full read"""
+        self.__inode = None
+        self.__offset = 0
+        try:
+            with open(self.path, 'rb') as f:
+                self.__inode = os.fstat(f.fileno()).st_ino
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    self.value = json.loads(line)["gen"]
+                    self.__offset += len(line)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+"""
+Contains the Journal class
+"""
+
+from models.engine import serializer
+from models.engine import snapshot
+import os
+import threading
+
+
+class Journal:
+    """
+    Append-only log of object changes kept next to a JSON snapshot
+    """
+
+    def __init__(self, snapshot_path, max_size=1 << 20):
+        """Instantiate a Journal for the snapshot at snapshot_path"""
+        self.snapshot_path = snapshot_path
+        self.path = snapshot_path + ".log"
+        self.compacting_path = snapshot_path + ".log.compacting"
+        self.max_size = max_size
+        self.fsync = False
+        self.__lock = threading.Lock()
+        self.__compactor = None
+
+    def append(self, records):
+        """appends (key, dict) records to the log, dict None for deletes,
+        on a new line when a crash left the last record half-written"""
+        if not records:
+            return
+        with open(self.path, 'ab+') as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            for key, value in records:
+                if value is None:
+                    record = {"op": "del", "key": key}
+                else:
+                    record = {"op": "put", "key": key, "value": value}
+                f.write(serializer.dumpb(record) + b"\n")
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+            size = f.tell()
+        if size >= self.max_size:
+            self.compact()
+
+    def load(self):
+        """returns the snapshot dict with every logged change applied"""
+        with self.__lock:
+            json_dict = self._read_snapshot()
+            self._replay(self.compacting_path, json_dict)
+            self._replay(self.path, json_dict)
+        return json_dict
+
+    def compact(self):
+        """folds the log into a new snapshot in a background thread"""
+        with self.__lock:
+            if self.__compactor and self.__compactor.is_alive():
+                return
+            if not os.path.exists(self.compacting_path):
+                os.replace(self.path, self.compacting_path)
+            self.__compactor = threading.Thread(target=self._fold)
+            self.__compactor.start()
+
+    def wait(self):
+        """blocks until a running compaction has finished"""
+        if self.__compactor:
+            self.__compactor.join()
+
+    def _fold(self):
+        """writes snapshot + rotated log as the new snapshot"""
+        json_dict = self._read_snapshot()
+        self._replay(self.compacting_path, json_dict)
+        text = serializer.dumps(json_dict)
+        with self.__lock:
+            snapshot.dump(self.snapshot_path, text)
+            os.remove(self.compacting_path)
+
+    def _read_snapshot(self):
+        """returns the content of the snapshot file, {} if there is none"""
+        try:
+            return snapshot.load(self.snapshot_path)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _replay(path, json_dict):
+        """applies the records logged in path to json_dict, skipping torn
+        lines"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = serializer.loads(line)
+                    except ValueError:
+                        continue
+                    if record["op"] == "put":
+                        json_dict[record["key"]] = record["value"]
+                    else:
+                        json_dict.pop(record["key"], None)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""
+Contains the RWLock class
+"""
+
+from contextlib import contextmanager
+import threading
+
+
+class RWLock:
+    """
+    Lets many readers in at once, or one writer on its own
+
+    Writers are reentrant and may also read; a thread holding a read lock
+    must not ask for the write lock. Waiting writers stop new readers so
+    they cannot be starved.
+    """
+
+    def __init__(self):
+        """Instantiate an unlocked RWLock"""
+        self.__cond = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__writer = None
+        self.__depth = 0
+        self.__waiting = 0
+        self.__local = threading.local()
+
+    @contextmanager
+    def read(self):
+        """holds a shared lock for the duration of the with block"""
+        me = threading.get_ident()
+        held = getattr(self.__local, "reads", 0)
+        with self.__cond:
+            if self.__writer != me and not held:
+                while self.__writer is not None or self.__waiting:
+                    self.__cond.wait()
+            self.__readers += 1
+        self.__local.reads = held + 1
+        try:
+            yield
+        finally:
+            self.__local.reads = held
+            with self.__cond:
+                self.__readers -= 1
+                if not self.__readers:
+                    self.__cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        """holds the exclusive lock for the duration of the with block"""
+        me = threading.get_ident()
+        with self.__cond:
+            if self.__writer == me:
+                self.__depth += 1
+            else:
+                self.__waiting += 1
+                while self.__writer is not None or self.__readers:
+                    self.__cond.wait()
+                self.__waiting -= 1
+                self.__writer = me
+                self.__depth = 1
+        try:
+            yield
+        finally:
+            with self.__cond:
+                self.__depth -= 1
+                if not self.__depth:
+                    self.__writer = None
+                    self.__cond.notify_all()
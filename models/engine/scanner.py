@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""
+Streams the records of a FileStorage JSON file without parsing them
+"""
+
+import json
+import re
+
+_END = re.compile(rb'\s*[{,]?\s*}')
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_KEY = re.compile(rb'\s*[{,]?\s*(' + _STRING + rb')\s*:\s*')
+_FLAT = re.compile(rb'\{[^{}"]*(?:' + _STRING + rb'[^{}"]*)*\}')
+_TOKEN = re.compile(_STRING + rb'|"|[{}\[\]]')
+
+
+def scan(f, chunk_size=1 << 20):
+    """yields (key, offset, length) for each record of the binary file f,
+    raising ValueError if the JSON object ends before its closing brace"""
+    buf = b""
+    base = 0
+    pos = 0
+    eof = False
+    while True:
+        if _END.match(buf, pos):
+            return
+        record = _next_record(buf, pos)
+        if record is None:
+            if eof:
+                raise ValueError("torn or corrupt snapshot")
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            base += pos
+            pos = 0
+            continue
+        key, start, pos = record
+        yield key, base + start, pos - start
+
+
+def _next_record(buf, pos):
+    """returns (key, start, end) of the record at pos, None if cut short"""
+    m = _KEY.match(buf, pos)
+    if not m:
+        return None
+    key = m.group(1)
+    if b"\\" in key:
+        key = json.loads(key)
+    else:
+        key = key[1:-1].decode()
+    start = m.end()
+    flat = _FLAT.match(buf, start)
+    if flat:
+        return key, start, flat.end()
+    depth = 0
+    for token in _TOKEN.finditer(buf, start):
+        tok = token.group()
+        if tok == b'"':
+            return None
+        if tok[:1] == b'"':
+            continue
+        if tok in (b"{", b"["):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return key, start, token.end()
+    return None
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+JSON encoding shared by the storage engines and the API: orjson when it is
+installed, the standard json module otherwise. Both write datetimes in the
+time format below, the one BaseModel.to_dict() uses, microseconds included
+"""
+
+from datetime import datetime
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+backend = "orjson" if orjson else "json"
+time = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def _default(obj):
+    """encodes the values the json module does not know about"""
+    if isinstance(obj, datetime):
+        return obj.strftime(time)
+    raise TypeError("Object of type {} is not JSON serializable".format(
+        obj.__class__.__name__))
+
+
+def dumpb(obj):
+    """returns obj encoded as UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj, default=_default,
+                            option=orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj, default=_default, ensure_ascii=False).encode()
+
+
+def dumps(obj):
+    """returns obj encoded as a JSON string"""
+    if orjson:
+        return dumpb(obj).decode()
+    return json.dumps(obj, default=_default, ensure_ascii=False)
+
+
+def loads(data):
+    """returns the object encoded in the JSON str or bytes data"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""
+Reads and writes storage snapshots: a JSON object followed by a footer line
+holding its length and CRC-32, so that torn files are detected
+"""
+
+from models.engine import serializer
+import os
+import tempfile
+import zlib
+
+_FOOTER = b"#crc32 "
+
+
+def dump(path, text, fsync=True):
+    """atomically replaces path with the JSON text and its footer"""
+    data = text.encode()
+    footer = "\n#crc32 {:08x} {}\n".format(zlib.crc32(data), len(data))
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp",
+                                    prefix=os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.write(footer.encode())
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def load(path):
+    """returns the object stored in the snapshot at path"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def check(f):
+    """checks the footer of the open binary snapshot f against the body
+    before it, raising ValueError if they do not match, and rewinds f;
+    files without one are not checked"""
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - 64))
+    tail = f.read()
+    start = tail.rfind(b"\n", 0, len(tail) - 1) + 1
+    if tail.startswith(_FOOTER, start):
+        crc, length = tail[start + len(_FOOTER):].split()
+        remaining = size - len(tail) + start - 1
+        if remaining != int(length):
+            raise ValueError("torn or corrupt snapshot")
+        f.seek(0)
+        value = 0
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            value = zlib.crc32(chunk, value)
+            remaining -= len(chunk)
+        if value != int(crc, 16):
+            raise ValueError("torn or corrupt snapshot")
+    f.seek(0)
+
+
+def loads(data):
+    """returns the object stored in the snapshot bytes or str data, raising
+    ValueError if its footer does not match; files without one are read
+    as plain JSON"""
+    if isinstance(data, str):
+        data = data.encode()
+    start = data.rfind(b"\n", 0, len(data) - 1) + 1
+    if data.startswith(_FOOTER, start):
+        crc, length = data[start + len(_FOOTER):].split()
+        body = data[:start - 1]
+        if len(body) != int(length) or \
+                zlib.crc32(body) != int(crc, 16):
+            raise ValueError("torn or corrupt snapshot")
+        data = body
+    return serializer.loads(data)
@@ -0,0 +1,331 @@
+#!/usr/bin/python3
+"""
+Contains the class SQLiteStorage
+"""
+
+from models.engine import serializer
+from models.amenity import Amenity
+from models.base_model import BaseModel
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from os import getenv
+import sqlite3
+import threading
+
+classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
+           "Place": Place, "Review": Review, "State": State, "User": User}
+
+fk_columns = {"City": ("state_id",), "Place": ("city_id", "user_id"),
+              "Review": ("place_id", "user_id")}
+
+
+class Pending(threading.local):
+    """
+    the objects one thread loaded and the changes it has not saved yet
+    """
+
+    def __init__(self):
+        """Instantiate the empty state of the calling thread"""
+        self.objects = {}
+        self.loaded = {}
+        self.dirty = set()
+        self.deleted = {}
+
+
+class SQLiteStorage:
+    """
+    stores every class in its own table of a local SQLite database
+
+    Like the scoped session of DBStorage, the loaded objects and unsaved
+    changes belong to the thread that made them: close() at the end of one
+    request only forgets that request's thread state.
+    """
+
+    def __init__(self):
+        """Instantiate a SQLiteStorage object"""
+        self.__path = getenv("HBNB_SQLITE_PATH", "hbnb.db")
+        self.__conn = None
+        self.__lock = threading.RLock()
+        self.__pending = Pending()
+
+    def all(self, cls=None, load=None):
+        """returns a dictionary of the objects of cls, or of every class;
+        load is ignored, relationship getters use indexed foreign keys"""
+        names = [self._name(cls)] if cls else list(classes)
+        new_dict = {}
+        rows = self._query(" UNION ALL ".join(
+            "SELECT '{0}', data FROM {0}".format(name) for name in names))
+        for name, data in rows:
+            obj = self._object(name, data)
+            new_dict["{}.{}".format(name, obj.id)] = obj
+        for key, obj in list(self.__pending.objects.items()):
+            if key.split(".")[0] in names:
+                new_dict[key] = obj
+        for key in self.__pending.deleted:
+            new_dict.pop(key, None)
+        return new_dict
+
+    def new(self, obj):
+        """adds obj to the objects written by the next save()"""
+        key = "{}.{}".format(obj.__class__.__name__, obj.id)
+        with self.__lock:
+            self.__pending.objects[key] = obj
+            self.__pending.dirty.add(key)
+            self.__pending.deleted.pop(key, None)
+
+    def touch(self, obj, attr=None):
+        """flags obj as modified, save() also compares the loaded ones"""
+        obj_id = obj.__dict__.get("id")
+        if obj_id is not None:
+            key = "{}.{}".format(obj.__class__.__name__, obj_id)
+            self.__pending.dirty.add(key)
+
+    def save(self):
+        """writes the new, modified and deleted objects in one transaction"""
+        pending = self.__pending
+        with self.__lock:
+            with self.__conn:
+                for key, obj in pending.deleted.items():
+                    name = key.split(".")[0]
+                    self.__conn.execute(
+                        "DELETE FROM {} WHERE id = ?".format(name), (obj.id,))
+                for key, obj in pending.objects.items():
+                    data = serializer.dumps(obj.to_dict(save_fs=1,
+                                                        format_dates=False))
+                    if key in pending.dirty or data != pending.loaded.get(key):
+                        self._write(obj, data)
+                        pending.loaded[key] = data
+            pending.dirty.clear()
+            pending.deleted.clear()
+
+    def delete(self, obj=None):
+        """deletes obj from the database on the next save()"""
+        if obj:
+            key = "{}.{}".format(obj.__class__.__name__, obj.id)
+            with self.__lock:
+                self.__pending.objects.pop(key, None)
+                self.__pending.loaded.pop(key, None)
+                self.__pending.dirty.discard(key)
+                self.__pending.deleted[key] = obj
+
+    def reload(self):
+        """opens the database and creates the missing tables and indexes"""
+        with self.__lock:
+            self.__conn = sqlite3.connect(self.__path,
+                                          check_same_thread=False)
+            self.__conn.execute("PRAGMA journal_mode=WAL")
+            self.__conn.execute("PRAGMA synchronous=NORMAL")
+            with self.__conn:
+                for name in classes:
+                    columns = "".join(", {} TEXT".format(column)
+                                      for column in fk_columns.get(name, ()))
+                    self.__conn.execute(
+                        "CREATE TABLE IF NOT EXISTS {} (id TEXT PRIMARY KEY"
+                        "{}, data TEXT NOT NULL)".format(name, columns))
+                    for column in fk_columns.get(name, ()):
+                        self.__conn.execute(
+                            "CREATE INDEX IF NOT EXISTS {0}_{1} "
+                            "ON {0} ({1})".format(name, column))
+
+    def close(self):
+        """forgets the objects loaded and the changes not saved yet by the
+        calling thread"""
+        self.__pending.objects.clear()
+        self.__pending.loaded.clear()
+        self.__pending.dirty.clear()
+        self.__pending.deleted.clear()
+
+    def get(self, cls, id, load=None):
+        """Retrieve one object"""
+        name = self._name(cls)
+        key = "{}.{}".format(name, id)
+        if key in self.__pending.deleted:
+            return None
+        obj = self.__pending.objects.get(key)
+        if obj is not None:
+            return obj
+        rows = self._query("SELECT data FROM {} WHERE id = ?".format(name),
+                           (id,))
+        return self._object(name, rows[0][0]) if rows else None
+
+    def get_many(self, cls, ids, load=None):
+        """returns the objects of cls with the given ids in their order,
+        skipping unknown ids; those not loaded yet are read in one query"""
+        name = self._name(cls)
+        found = {}
+        missing = []
+        for id in ids:
+            key = "{}.{}".format(name, id)
+            if key in self.__pending.deleted:
+                continue
+            obj = self.__pending.objects.get(key)
+            if obj is not None:
+                found[id] = obj
+            else:
+                missing.append(id)
+        if missing:
+            rows = self._query("SELECT data FROM {} WHERE id IN ({})".format(
+                name, ", ".join("?" * len(missing))), missing)
+            for row in rows:
+                obj = self._object(name, row[0])
+                found[obj.id] = obj
+        return [found[id] for id in ids if id in found]
+
+    def page(self, cls, after=None, limit=None, order_by="id", where=None):
+        """returns up to limit objects of cls whose attributes equal the
+        where {attr: value} pairs, ordered by order_by then id, following
+        the object whose id is after"""
+        name = self._name(cls)
+        sql = "SELECT data FROM {} WHERE 1".format(name)
+        params = []
+        for attr, value in (where or {}).items():
+            sql += " AND {} = ?".format(self._column(name, attr))
+            params.append(value)
+        column = self._column(name, order_by)
+        if after is not None and order_by == "id":
+            sql += " AND id > ?"
+            params.append(after)
+        elif after is not None:
+            sql += " AND ({0}, id) > ((SELECT {0} FROM {1} WHERE id = ?)," \
+                " ?)".format(column, name)
+            params += [after, after]
+        sql += " ORDER BY {}, id".format(column) if order_by != "id" \
+            else " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        objs = [self._object(name, row[0]) for row in self._query(sql, params)]
+        return [obj for obj in objs
+                if "{}.{}".format(name, obj.id) not in self.__pending.deleted]
+
+    def stream(self, cls, where=None, batch=1000):
+        """yields the objects of cls whose attributes equal the where
+        {attr: value} pairs, reading batch rows per query; objects not
+        loaded yet are built without being kept"""
+        name = self._name(cls)
+        sql = "SELECT id, data FROM {} WHERE 1".format(name)
+        params = []
+        for attr, value in (where or {}).items():
+            sql += " AND {} = ?".format(self._column(name, attr))
+            params.append(value)
+        sql += " AND id > ? ORDER BY id LIMIT ?"
+        after = ""
+        while True:
+            rows = self._query(sql, params + [after, batch])
+            for id, data in rows:
+                key = "{}.{}".format(name, id)
+                if key in self.__pending.deleted:
+                    continue
+                obj = self.__pending.objects.get(key)
+                if obj is None:
+                    obj = classes[name].from_dict(serializer.loads(data))
+                yield obj
+            if len(rows) < batch:
+                return
+            after = rows[-1][0]
+
+    def _column(self, name, attr):
+        """returns the SQL expression reading attr from a row of name"""
+        if attr == "id" or attr in fk_columns.get(name, ()):
+            return attr
+        if not attr.isidentifier():
+            raise KeyError(attr)
+        return "json_extract(data, '$.{}')".format(attr)
+
+    def search_places(self, states=(), cities=(), amenities=(), after=None,
+                      limit=None, stream=False):
+        """returns the places in the given states or cities, or anywhere
+        without either, that have every given amenity, ordered by id from
+        after on, in one query; with stream, an iterator over them"""
+        sql = "SELECT data FROM Place WHERE 1"
+        params = []
+        if states or cities:
+            sql += " AND (city_id IN (SELECT id FROM City WHERE state_id " \
+                "IN ({})) OR city_id IN ({}))".format(
+                    ", ".join("?" * len(states)), ", ".join("?" * len(cities)))
+            params += list(states) + list(cities)
+        if amenities:
+            wanted = list(set(amenities))
+            marks = ", ".join("?" * len(wanted))
+            sql += " AND (SELECT COUNT(*) FROM Amenity WHERE id IN ({0}))" \
+                " = ? AND id IN (SELECT Place.id FROM Place, json_each(" \
+                "Place.data, '$.amenity_ids') AS a WHERE a.value IN ({0})" \
+                " GROUP BY Place.id HAVING COUNT(DISTINCT a.value) = ?)" \
+                .format(marks)
+            params += wanted + [len(wanted)] + wanted + [len(wanted)]
+        if after is not None:
+            sql += " AND id > ?"
+            params.append(after)
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        places = [self._object("Place", row[0])
+                  for row in self._query(sql, params)]
+        places = [place for place in places
+                  if "Place." + place.id not in self.__pending.deleted]
+        return iter(places) if stream else places
+
+    def count(self, cls=None):
+        """Count the number of objects in storage"""
+        if cls:
+            return self.counts([cls])[self._name(cls)]
+        return sum(self.counts().values())
+
+    def counts(self, cls_list=None):
+        """returns {class name: number of objects} for the classes in
+        cls_list, or every class, in one statement"""
+        names = [self._name(cls) for cls in cls_list] if cls_list \
+            else list(classes)
+        row = self._query("SELECT " + ", ".join(
+            "(SELECT COUNT(*) FROM {})".format(name) for name in names))[0]
+        return dict(zip(names, row))
+
+    def related(self, cls, attr, value):
+        """returns the objects of cls whose foreign key attr equals value"""
+        name = self._name(cls)
+        if attr not in fk_columns.get(name, ()):
+            return [obj for obj in self.all(cls).values()
+                    if getattr(obj, attr, None) == value]
+        rows = self._query("SELECT data FROM {} WHERE {} = ?".format(
+            name, attr), (value,))
+        return [self._object(name, row[0]) for row in rows]
+
+    def _name(self, cls):
+        """returns the table name of cls, a class or a class name"""
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in classes:
+            raise KeyError(name)
+        return name
+
+    def _query(self, sql, params=()):
+        """runs a SELECT statement and returns all its rows"""
+        with self.__lock:
+            return self.__conn.execute(sql, params).fetchall()
+
+    def _write(self, obj, data):
+        """inserts or replaces the row of obj with its JSON data"""
+        name = obj.__class__.__name__
+        columns = fk_columns.get(name, ())
+        values = [obj.id] + [getattr(obj, column, None)
+                             for column in columns]
+        values.append(data)
+        names = ["id"] + list(columns) + ["data"]
+        self.__conn.execute(
+            "INSERT OR REPLACE INTO {} ({}) VALUES ({})".format(
+                name, ", ".join(names), ", ".join("?" * len(names))),
+            values)
+
+    def _object(self, name, data):
+        """returns the loaded object stored as data, building it if needed"""
+        value = serializer.loads(data)
+        key = "{}.{}".format(name, value["id"])
+        obj = self.__pending.objects.get(key)
+        if obj is None:
+            obj = classes[name].from_dict(value)
+            self.__pending.objects[key] = obj
+            self.__pending.loaded[key] = data
+        return obj
@@ -158,3 +158,30 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_kwargs_share_ids_and_dates(self):
+        """Test that loaded ids are interned and equal dates shared"""
+        inst = BaseModel()
+        d = inst.to_dict()
+        copy = BaseModel(**{k: "".join(list(v)) for k, v in d.items()})
+        self.assertIs(copy.id, inst.id)
+        self.assertIs(copy.updated_at, copy.created_at)
+        inst.parent_id = "".join(list(copy.id))
+        self.assertIs(inst.parent_id, copy.id)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    @mock.patch('models.storage')
+    def test_from_dict(self, mock_storage):
+        """Test that from_dict rebuilds an instance without the hooks"""
+        inst = BaseModel()
+        inst.name = "Holberton"
+        d = inst.to_dict()
+        loaded = BaseModel.from_dict(d)
+        self.assertEqual(loaded.to_dict(), d)
+        self.assertEqual(loaded.created_at, inst.created_at)
+        self.assertIs(loaded.updated_at, loaded.created_at)
+        self.assertIs(loaded.id, inst.id)
+        mock_storage.touch.reset_mock()
+        BaseModel.from_dict(d)
+        self.assertFalse(mock_storage.touch.called)
@@ -17,7 +17,11 @@ from models.user import User
 import json
 import os
 import pep8
+import sqlalchemy
+from sqlalchemy import exc
+import tempfile
 import unittest
+from unittest import mock
 
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity, "City": City, "Place": Place,
@@ -87,3 +91,229 @@ class TestFileStorage(unittest.TestCase):
     @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
     def test_save(self):
         """Test that save properly saves objects to file.json"""
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_counts_one_statement(self):
+        """Test that counts() runs one statement for every class"""
+        with models.storage.count_statements() as statements:
+            counts = models.storage.counts()
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(set(counts), set(classes))
+        self.assertEqual(sum(counts.values()), models.storage.count())
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_get_uses_identity_map(self):
+        """Test that get() and get_many() only query ids not loaded yet"""
+        states = [State(name="State {}".format(i)) for i in range(3)]
+        for state in states:
+            models.storage.new(state)
+        models.storage.save()
+        models.storage.close()
+        with models.storage.count_statements() as statements:
+            loaded = models.storage.get(State, states[1].id)
+            self.assertIs(models.storage.get(State, states[1].id), loaded)
+            self.assertEqual(len(statements), 1)
+            ids = [states[2].id, "missing", states[1].id, states[0].id]
+            found = models.storage.get_many(State, ids)
+            self.assertEqual(len(statements), 2)
+        self.assertEqual([s.name for s in found],
+                         ["State 2", "State 1", "State 0"])
+        self.assertIs(found[1], loaded)
+        for state in found:
+            models.storage.delete(state)
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_load_eager_loads_relationships(self):
+        """Test that load fetches relationships in a fixed number of
+        statements, whatever the number of parents"""
+        states = [State(name="State {}".format(i)) for i in range(3)]
+        cities = [City(name="City", state_id=state.id) for state in states]
+        for obj in states + cities:
+            models.storage.new(obj)
+        models.storage.save()
+        models.storage.close()
+        with models.storage.count_statements() as statements:
+            loaded = models.storage.all("State", load=["cities"])
+            for state in loaded.values():
+                state.cities
+            self.assertEqual(len(statements), 2)
+        models.storage.close()
+        ids = [state.id for state in states]
+        with models.storage.count_statements() as statements:
+            for state in models.storage.get_many(State, ids,
+                                                 load=["cities.places"]):
+                for city in state.cities:
+                    self.assertEqual(city.places, [])
+            self.assertEqual(len(statements), 3)
+        for obj in cities + states:
+            models.storage.delete(models.storage.get(type(obj), obj.id))
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_search_places_one_statement(self):
+        """Test that search_places() filters in one statement"""
+        state = State(name="Ohio")
+        city = City(name="Akron", state_id=state.id)
+        user = User(email="a@b.c", password="pwd")
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        loft = Place(name="Loft", city_id=city.id, user_id=user.id)
+        barn = Place(name="Barn", city_id=city.id, user_id=user.id)
+        loft.amenities.extend([wifi, pool])
+        barn.amenities.append(wifi)
+        objs = [state, city, user, wifi, pool, loft, barn]
+        for obj in objs:
+            models.storage.new(obj)
+        models.storage.save()
+        models.storage.close()
+        with models.storage.count_statements() as statements:
+            found = models.storage.search_places(
+                states=[state.id], amenities=[wifi.id, pool.id])
+        self.assertEqual(len(statements), 1)
+        self.assertEqual([place.name for place in found], ["Loft"])
+        self.assertEqual(len(models.storage.search_places(
+            cities=[city.id], amenities=[wifi.id])), 2)
+        for obj in reversed(objs):
+            models.storage.delete(models.storage.get(type(obj), obj.id))
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_migrate_creates_missing_indexes(self):
+        """Test that migrate() adds a dropped index back and that lookups
+        by state use it"""
+        engine = models.storage._DBStorage__engine
+        index = [i for i in City.__table__.indexes
+                 if i.name == "ix_cities_state_id"][0]
+        index.drop(engine)
+        self.assertEqual(models.storage.migrate(), ["ix_cities_state_id"])
+        self.assertEqual(models.storage.migrate(), [])
+        query = models.storage._DBStorage__session.query(City).filter(
+            City.state_id == "id")
+        self.assertTrue(any("ix_cities_state_id" in line
+                            for line in models.storage.explain(query)))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_page(self):
+        """Test that page() walks a class in keyset order"""
+        state = State(name="Ohio")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ["Kent", "Akron", "Dayton"]]
+        for obj in [state] + cities:
+            models.storage.new(obj)
+        models.storage.save()
+        where = {"state_id": state.id}
+        ids = sorted(city.id for city in cities)
+        first = models.storage.page(City, limit=2, where=where)
+        self.assertEqual([c.id for c in first], ids[:2])
+        self.assertEqual([c.id for c in models.storage.page(
+            City, after=first[-1].id, where=where)], ids[2:])
+        by_name = models.storage.page(City, limit=2, order_by="name",
+                                      where=where)
+        self.assertEqual([c.name for c in by_name], ["Akron", "Dayton"])
+        self.assertEqual([c.name for c in models.storage.page(
+            City, after=by_name[-1].id, order_by="name", where=where)],
+            ["Kent"])
+        for obj in cities + [state]:
+            models.storage.delete(obj)
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_stream(self):
+        """Test that stream() reads a class in batches in its own session"""
+        state = State(name="Ohio")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ["Kent", "Akron", "Dayton"]]
+        for obj in [state] + cities:
+            models.storage.new(obj)
+        models.storage.save()
+        streamed = list(models.storage.stream(City, {"state_id": state.id},
+                                              batch=2))
+        self.assertEqual(sorted(c.id for c in streamed),
+                         sorted(c.id for c in cities))
+        self.assertTrue(all(sqlalchemy.inspect(c).detached
+                            for c in streamed))
+        found = models.storage.search_places(cities=[cities[0].id],
+                                             stream=True)
+        self.assertEqual(list(found), [])
+        for obj in cities + [state]:
+            models.storage.delete(obj)
+        models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_all_objects_belong_to_session(self):
+        """Test that all() returns objects of the current session"""
+        state = State(name="Ohio")
+        state.save()
+        for workers in [1, len(classes)]:
+            with self.subTest(workers=workers):
+                models.storage._DBStorage__load_workers = workers
+                models.storage.close()
+                loaded = models.storage.all()["State." + state.id]
+                self.assertIn(loaded, models.storage._DBStorage__session())
+                self.assertEqual(loaded.name, "Ohio")
+        models.storage._DBStorage__load_workers = 1
+        models.storage.delete(loaded)
+        models.storage.save()
+
+
+class TestDBStoragePool(unittest.TestCase):
+    """Test the DBStorage connection pool settings and metrics"""
+    def setUp(self):
+        """points DBStorage at a SQLite file in a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = {"HBNB_MYSQL_URL": "sqlite:///" + os.path.join(
+            self.tmp.name, "hbnb.db")}
+
+    def tearDown(self):
+        """removes the temporary directory"""
+        self.tmp.cleanup()
+
+    def storage(self, **env):
+        """returns a DBStorage built with env added to the environment"""
+        env.update(self.env)
+        with mock.patch.dict(os.environ, env):
+            os.environ.pop("HBNB_ENV", None)
+            return DBStorage()
+
+    def test_pool_options_from_env(self):
+        """Test that the HBNB_MYSQL_* variables configure the pool"""
+        storage = self.storage(HBNB_MYSQL_POOL_SIZE="3",
+                               HBNB_MYSQL_MAX_OVERFLOW="2",
+                               HBNB_MYSQL_POOL_TIMEOUT="4.5",
+                               HBNB_MYSQL_POOL_RECYCLE="600",
+                               HBNB_MYSQL_POOL_PRE_PING="1")
+        pool = storage._DBStorage__engine.pool
+        self.assertIsInstance(pool, db_storage.MeteredQueuePool)
+        self.assertEqual(pool.size(), 3)
+        self.assertEqual(pool._max_overflow, 2)
+        self.assertEqual(pool._timeout, 4.5)
+        self.assertEqual(pool._recycle, 600)
+        self.assertTrue(pool._pre_ping)
+
+    def test_metrics_pool_usage(self):
+        """Test that metrics counts checkouts and connections in use"""
+        storage = self.storage(HBNB_MYSQL_POOL_SIZE="2")
+        engine = storage._DBStorage__engine
+        with engine.connect(), engine.connect():
+            metrics = storage.metrics()
+            self.assertEqual(metrics["checked_out"], 2)
+        metrics = storage.metrics()
+        self.assertEqual(metrics["pool_size"], 2)
+        self.assertEqual(metrics["checked_out"], 0)
+        self.assertEqual(metrics["peak_checked_out"], 2)
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertEqual(metrics["timeouts"], 0)
+
+    def test_metrics_wait_on_exhaustion(self):
+        """Test that metrics records waits that end in a pool timeout"""
+        storage = self.storage(HBNB_MYSQL_POOL_SIZE="1",
+                               HBNB_MYSQL_MAX_OVERFLOW="0",
+                               HBNB_MYSQL_POOL_TIMEOUT="0.05")
+        engine = storage._DBStorage__engine
+        with engine.connect():
+            with self.assertRaises(exc.TimeoutError):
+                engine.connect()
+        metrics = storage.metrics()
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertGreaterEqual(metrics["wait_ms_max"], 40)
@@ -14,14 +14,23 @@ from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from models.engine import snapshot
 import json
+import multiprocessing
 import os
 import pep8
+import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
+default_env = {"HBNB_FILE_JOURNAL": "0", "HBNB_FILE_SHARDS": "0",
+               "HBNB_FILE_LAZY": "0", "HBNB_FILE_MULTIPROCESS": "0",
+               "HBNB_FILE_DURABILITY": "sync"}
 
 
 class TestFileStorageDocs(unittest.TestCase):
@@ -71,7 +80,28 @@ test_file_storage.py'])
 
 class TestFileStorage(unittest.TestCase):
     """Test the FileStorage class"""
-    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def setUp(self):
+        """Build each FileStorage in the default modes, whatever the
+        environment of the test run, unless a test asks for another one"""
+        env = mock.patch.dict(os.environ, default_env)
+        env.start()
+        self.addCleanup(env.stop)
+
+    def scratch_storage(self, env=None):
+        """Return a FileStorage built with the env variables, whose file,
+        log and shards are kept in a directory removed after the test"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "file.json")
+        with mock.patch.dict(os.environ, env or {}):
+            with mock.patch.object(FileStorage, "_FileStorage__file_path",
+                                   path):
+                storage = FileStorage()
+        storage._FileStorage__file_path = path
+        return storage
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
     def test_all_returns_dict(self):
         """Test that all returns the FileStorage.__objects attr"""
         storage = FileStorage()
@@ -79,7 +109,8 @@ class TestFileStorage(unittest.TestCase):
         self.assertEqual(type(new_dict), dict)
         self.assertIs(new_dict, storage._FileStorage__objects)
 
-    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
     def test_new(self):
         """test that new adds an object to the FileStorage.__objects attr"""
         storage = FileStorage()
@@ -95,7 +126,8 @@ class TestFileStorage(unittest.TestCase):
                 self.assertEqual(test_dict, storage._FileStorage__objects)
         FileStorage._FileStorage__objects = save
 
-    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
     def test_save(self):
         """Test that save properly saves objects to file.json"""
         storage = FileStorage()
@@ -111,6 +143,645 @@ class TestFileStorage(unittest.TestCase):
         for key, value in new_dict.items():
             new_dict[key] = value.to_dict()
         string = json.dumps(new_dict)
-        with open("file.json", "r") as f:
-            js = f.read()
-        self.assertEqual(json.loads(string), json.loads(js))
+        self.assertEqual(json.loads(string), snapshot.load("file.json"))
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_related_follows_new_and_delete(self):
+        """Test that the foreign-key indexes track new() and delete()"""
+        storage = FileStorage()
+        state = State(name="California")
+        other = State(name="Nevada")
+        city = City(name="Fresno", state_id=state.id)
+        storage.new(state)
+        storage.new(other)
+        storage.new(city)
+        self.assertEqual(storage.related(City, "state_id", state.id), [city])
+        city.state_id = other.id
+        storage.new(city)
+        self.assertEqual(storage.related(City, "state_id", state.id), [])
+        self.assertEqual(other.cities, [city])
+        storage.delete(city)
+        self.assertEqual(other.cities, [])
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_related_after_reload(self):
+        """Test that reload() rebuilds the foreign-key indexes"""
+        storage = FileStorage()
+        place = Place(name="Loft")
+        review = Review(place_id=place.id, text="Great")
+        storage.new(place)
+        storage.new(review)
+        storage.save()
+        storage.reload()
+        reviews = storage.related(Review, "place_id", place.id)
+        self.assertEqual([r.id for r in reviews], [review.id])
+        self.assertIsNot(reviews[0], review)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_all_cls_returns_bucket_view(self):
+        """Test that all(cls) returns a read-only view of one class"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        key = "State." + state.id
+        for cls in [State, "State"]:
+            with self.subTest(cls=cls):
+                states = storage.all(cls)
+                self.assertIs(states[key], state)
+                self.assertTrue(all(type(obj) is State
+                                    for obj in states.values()))
+                with self.assertRaises(TypeError):
+                    states[key] = None
+        self.assertIn(key, storage.all(BaseModel))
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_count(self):
+        """Test that count() tracks new() and delete() per class"""
+        storage = FileStorage()
+        total = storage.count()
+        amenities = storage.count(Amenity)
+        amenity = Amenity()
+        storage.new(amenity)
+        self.assertEqual(storage.count(Amenity), amenities + 1)
+        self.assertEqual(storage.count(), total + 1)
+        storage.delete(amenity)
+        self.assertEqual(storage.count(Amenity), amenities)
+        self.assertEqual(storage.count(), total)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_counts(self):
+        """Test that counts() returns count() for each class"""
+        storage = FileStorage()
+        storage.new(Amenity())
+        counts = storage.counts()
+        self.assertEqual(set(counts), set(classes))
+        for name, cls in classes.items():
+            self.assertEqual(counts[name], storage.count(cls))
+        self.assertEqual(storage.counts([Amenity, "State"]),
+                         {"Amenity": storage.count(Amenity),
+                          "State": storage.count(State)})
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_get_many(self):
+        """Test that get_many() returns known ids in order, lazy or not"""
+        storage = self.scratch_storage({"HBNB_FILE_LAZY": "1"})
+        self.addCleanup(storage.all)
+        states = [State(name="State {}".format(i)) for i in range(3)]
+        with open(storage._FileStorage__file_path, "w") as f:
+            json.dump({"State." + s.id: s.to_dict() for s in states}, f)
+        storage.reload()
+        objects = storage._FileStorage__objects
+        ids = [states[2].id, "missing", states[0].id]
+        found = storage.get_many(State, ids)
+        self.assertEqual([s.name for s in found], ["State 2", "State 0"])
+        self.assertNotIn("State." + states[1].id, objects)
+        self.assertIs(storage.get_many(State, ids, load=["cities"])[0],
+                      found[0])
+        self.assertEqual(storage.get_many(City, ids), [])
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_search_places(self):
+        """Test that search_places() filters by location and amenities"""
+        storage = FileStorage()
+        state = State(name="Ohio")
+        akron = City(name="Akron", state_id=state.id)
+        dayton = City(name="Dayton", state_id="elsewhere")
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        places = [Place(name="Loft", city_id=akron.id,
+                        amenity_ids=[wifi.id, pool.id]),
+                  Place(name="Barn", city_id=akron.id, amenity_ids=[wifi.id]),
+                  Place(name="Yurt", city_id=dayton.id,
+                        amenity_ids=[pool.id, wifi.id])]
+        objs = [state, akron, dayton, wifi, pool] + places
+        for obj in objs:
+            storage.new(obj)
+        for obj in objs:
+            self.addCleanup(storage.delete, obj)
+        search = storage.search_places
+
+        def names(places):
+            """returns the sorted names of places"""
+            return sorted(place.name for place in places)
+
+        self.assertEqual(names(search(states=[state.id])), ["Barn", "Loft"])
+        self.assertEqual(names(search(states=[state.id], cities=[dayton.id],
+                                      amenities=[pool.id, wifi.id])),
+                         ["Loft", "Yurt"])
+        self.assertEqual(search(amenities=[wifi.id, "missing"]), [])
+        found = search(amenities=[pool.id])
+        self.assertEqual(names(found), ["Loft", "Yurt"])
+        self.assertEqual([p.id for p in found],
+                         sorted(p.id for p in found))
+        self.assertEqual(search(amenities=[pool.id], after=found[0].id),
+                         found[1:])
+        self.assertEqual(search(amenities=[pool.id], limit=1), found[:1])
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_search_index_follows_writes(self):
+        """Test that the amenity and location indexes follow updates"""
+        storage = FileStorage()
+        state = State(name="Ohio")
+        city = City(name="Akron", state_id="elsewhere")
+        wifi = Amenity(name="Wifi")
+        place = Place(name="Loft", city_id=city.id)
+        objs = [state, city, wifi, place]
+        for obj in objs:
+            storage.new(obj)
+        for obj in objs:
+            self.addCleanup(storage.delete, obj)
+        search = storage.search_places
+        self.assertEqual(search(amenities=[wifi.id]), [])
+        place.amenity_ids = place.amenity_ids + [wifi.id]
+        self.assertEqual(search(amenities=[wifi.id]), [place])
+        self.assertEqual(storage.related(Place, "amenity_ids", wifi.id),
+                         [place])
+        self.assertEqual(search(states=[state.id]), [])
+        city.state_id = state.id
+        self.assertEqual(search(states=[state.id], amenities=[wifi.id]),
+                         [place])
+        place.amenity_ids = []
+        self.assertEqual(search(amenities=[wifi.id]), [])
+        place.amenity_ids = [wifi.id]
+        storage.delete(place)
+        self.assertEqual(search(amenities=[wifi.id]), [])
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_page(self):
+        """Test that page() walks a sorted view that follows writes"""
+        storage = FileStorage()
+        state = State(name="Ohio")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ["Kent", "Akron", "Dayton"]]
+        for obj in [state] + cities:
+            storage.new(obj)
+            self.addCleanup(storage.delete, obj)
+        where = {"state_id": state.id}
+        ids = sorted(city.id for city in cities)
+        first = storage.page(City, limit=2, where=where)
+        self.assertEqual([c.id for c in first], ids[:2])
+        self.assertEqual([c.id for c in storage.page(
+            City, after=first[-1].id, where=where)], ids[2:])
+        by_name = storage.page(City, limit=2, order_by="name", where=where)
+        self.assertEqual([c.name for c in by_name], ["Akron", "Dayton"])
+        cities[0].name = "Canton"
+        self.assertEqual([c.name for c in storage.page(
+            City, after=by_name[0].id, order_by="name", where=where)],
+            ["Canton", "Dayton"])
+        storage.delete(cities[1])
+        self.assertEqual(storage.page(City, after=cities[1].id,
+                                      order_by="name", where=where), [])
+        self.assertEqual(len(storage.page(City, where=where)), 2)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_stream(self):
+        """Test that stream() yields the objects matching where"""
+        storage = FileStorage()
+        state = State(name="Ohio")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ["Kent", "Akron"]]
+        for obj in [state] + cities:
+            storage.new(obj)
+            self.addCleanup(storage.delete, obj)
+        self.assertEqual(
+            sorted(c.id for c in storage.stream(City, {"state_id": state.id})),
+            sorted(c.id for c in cities))
+        self.assertIn(state, list(storage.stream(State)))
+        self.assertEqual(list(storage.stream(City, {"state_id": "id"})), [])
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_save_keeps_password_hash(self):
+        """Test that a saved user has the same password hash after reload"""
+        user = User(email="a@b.c", password="secret")
+        hashed = user.password
+        for env in [{}, {"HBNB_FILE_LAZY": "1"}, {"HBNB_FILE_SHARDS": "1"},
+                    {"HBNB_FILE_JOURNAL": "1"}]:
+            with self.subTest(env=env):
+                storage = self.scratch_storage(env)
+                storage.new(user)
+                storage.save()
+                stored = storage._read()["User." + user.id]
+                self.assertEqual(stored["password"], hashed)
+                storage._FileStorage__stamp = None
+                storage.close()
+                if not env:
+                    self.assertIs(storage.get(User, user.id), user)
+                storage.reload()
+                self.assertEqual(storage.get(User, user.id).password, hashed)
+                storage.all()
+                storage.delete(user)
+                storage.save()
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_journaled_save_appends_changes(self):
+        """Test that journaled save() logs only what changed"""
+        storage = self.scratch_storage({"HBNB_FILE_JOURNAL": "1"})
+        path = storage._FileStorage__file_path
+        state = State(name="Texas")
+        storage.new(state)
+        storage.save()
+        state.name = "Utah"
+        storage.save()
+        with open(path + ".log", 'r') as f:
+            records = [json.loads(line) for line in f]
+        records = [r for r in records if r["key"] == "State." + state.id]
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual([r["value"]["name"] for r in records],
+                         ["Texas", "Utah"])
+        storage.delete(state)
+        storage.save()
+        storage.reload()
+        self.assertNotIn("State." + state.id, storage.all())
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_save_reencodes_dirty_objects_only(self):
+        """Test that save() reuses the cached JSON of unchanged objects"""
+        storage = FileStorage()
+        changed = State(name="Ohio")
+        unchanged = State(name="Iowa")
+        storage.new(changed)
+        storage.new(unchanged)
+        storage.save()
+        changed.name = "Maine"
+        with mock.patch.object(State, "to_dict", autospec=True,
+                               side_effect=BaseModel.to_dict) as to_dict:
+            storage.save()
+        encoded = [call[0][0] for call in to_dict.call_args_list]
+        self.assertIn(changed, encoded)
+        self.assertNotIn(unchanged, encoded)
+        js = snapshot.load("file.json")
+        self.assertEqual(js["State." + changed.id]["name"], "Maine")
+        self.assertEqual(js["State." + unchanged.id]["name"], "Iowa")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_close_skips_unchanged_file(self):
+        """Test that close() does not re-read a file it is in sync with"""
+        storage = FileStorage()
+        storage.new(State(name="Idaho"))
+        storage.save()
+        with mock.patch.object(FileStorage, "_read") as read:
+            storage.close()
+        self.assertFalse(read.called)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_close_applies_delta(self):
+        """Test that close() only rebuilds records changed on disk"""
+        storage = FileStorage()
+        kept = State(name="Kansas")
+        changed = State(name="Ohio")
+        removed = State(name="Iowa")
+        for state in [kept, changed, removed]:
+            storage.new(state)
+        storage.save()
+        js = snapshot.load("file.json")
+        js["State." + changed.id]["name"] = "Maine"
+        del js["State." + removed.id]
+        added = State(name="Utah").to_dict()
+        js["State." + added["id"]] = added
+        with open("file.json", "w") as f:
+            json.dump(js, f)
+        storage._FileStorage__stamp = None
+        storage.close()
+        objs = storage.all()
+        self.assertIs(objs["State." + kept.id], kept)
+        self.assertEqual(objs["State." + changed.id].name, "Maine")
+        self.assertNotIn("State." + removed.id, objs)
+        self.assertEqual(objs["State." + added["id"]].name, "Utah")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_lazy_reload_builds_on_access(self):
+        """Test that lazy reload builds objects only when they are used"""
+        storage = self.scratch_storage({"HBNB_FILE_LAZY": "1"})
+        self.addCleanup(storage.all)
+        state = State(name="Vermont")
+        city = City(name="Burlington", state_id=state.id)
+        user = User(email="a@b.c")
+        js = {}
+        for obj in [state, city, user]:
+            js[obj.__class__.__name__ + "." + obj.id] = obj.to_dict()
+        with open(storage._FileStorage__file_path, "w") as f:
+            json.dump(js, f)
+        users = storage.count(User)
+        storage.reload()
+        objects = storage._FileStorage__objects
+        self.assertEqual(storage.count(User), users + 1)
+        self.assertNotIn("State." + state.id, objects)
+        self.assertEqual(storage.get(State, state.id).name, "Vermont")
+        self.assertIn("State." + state.id, objects)
+        self.assertNotIn("City." + city.id, objects)
+        storage.save()
+        cities = storage.related(City, "state_id", state.id)
+        self.assertEqual([c.name for c in cities], ["Burlington"])
+        self.assertEqual(storage.get(User, user.id).email, "a@b.c")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_lazy_offsets_follow_the_file(self):
+        """Test that lazy records are read from the file their offsets
+        were taken from, after a save() or a replace by another process"""
+        storage = self.scratch_storage({"HBNB_FILE_LAZY": "1"})
+        path = storage._FileStorage__file_path
+        filler = User(email="f" * 1000)
+        states = [State(name="Vermont"), State(name="Maine")]
+        city = City(name="Burlington", state_id=states[0].id)
+        for obj in [filler, city] + states:
+            self.addCleanup(FileStorage().delete, obj)
+        self.addCleanup(storage.all)
+
+        def layout(objs):
+            """Return the stored JSON text of objs in that order"""
+            return json.dumps({obj.__class__.__name__ + "." + obj.id:
+                               obj.to_dict() for obj in objs})
+
+        snapshot.dump(path, layout([filler] + states))
+        storage.reload()
+        storage.get(User, filler.id)
+        found = []
+        dump = snapshot.dump
+
+        def read():
+            """Read a lazy record, keeping its name or the error"""
+            try:
+                found.append(storage.get(State, states[0].id).name)
+            except Exception as e:
+                found.append(e)
+
+        def dump_then_read(*args):
+            """Replace the file, then read a lazy record meanwhile"""
+            dump(*args)
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(0.5)
+            readers.append(reader)
+
+        readers = []
+        storage.new(city)
+        with mock.patch.object(snapshot, "dump", side_effect=dump_then_read):
+            storage.save()
+        readers[0].join()
+        self.assertEqual(found, ["Vermont"])
+        snapshot.dump(path, layout([filler, city] + states))
+        self.assertEqual(storage.get(State, states[1].id).name, "Maine")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_sharded_save_writes_changed_classes(self):
+        """Test that sharded save() only rewrites the changed class files"""
+        storage = self.scratch_storage({"HBNB_FILE_SHARDS": "1"})
+        tmp = os.path.dirname(storage._FileStorage__file_path)
+        state = State(name="Oregon")
+        amenity = Amenity(name="Wifi")
+        storage.new(state)
+        storage.new(amenity)
+        storage.save()
+        for name in os.listdir(tmp):
+            if name != "State.json":
+                os.remove(os.path.join(tmp, name))
+        state.name = "Washington"
+        storage.save()
+        self.assertEqual(os.listdir(tmp), ["State.json"])
+        path = os.path.join(tmp, "State.json")
+        shard = file_storage.load_shard(path)
+        self.assertEqual(shard["State." + state.id].name, "Washington")
+        self.assertNotIn("Amenity." + amenity.id, shard)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_sharded_reload(self):
+        """Test that reload() merges the objects of every shard"""
+        storage = self.scratch_storage({"HBNB_FILE_SHARDS": "1"})
+        tmp = os.path.dirname(storage._FileStorage__file_path)
+        objs = {"State": State(name="Ohio"), "City": City(name="Akron")}
+        for name, obj in objs.items():
+            with open(os.path.join(tmp, name + ".json"), "w") as f:
+                json.dump({name + "." + obj.id: obj.to_dict()}, f)
+        storage.reload()
+        for name, obj in objs.items():
+            loaded = storage.get(obj.__class__, obj.id)
+            self.assertIsNot(loaded, obj)
+            self.assertEqual(loaded.to_dict(), obj.to_dict())
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_concurrent_readers_and_writers(self):
+        """Test that threads can read, write and save at the same time"""
+        storage = self.scratch_storage()
+        errors = []
+
+        def work(n):
+            """Create, update, list, save and delete states"""
+            try:
+                for i in range(50):
+                    state = State(name="{}-{}".format(n, i))
+                    storage.new(state)
+                    state.name = "x"
+                    len([s.to_dict() for s in storage.all(State).values()])
+                    storage.count()
+                    storage.get(State, state.id)
+                    if i % 10 == 0:
+                        storage.save()
+                    storage.delete(state)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,))
+                   for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        storage.save()
+        path = storage._FileStorage__file_path
+        self.assertIsInstance(snapshot.load(path), dict)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_multiprocess_save_keeps_other_writes(self):
+        """Test that a worker pulls what another process saved"""
+        storage = self.scratch_storage({"HBNB_FILE_MULTIPROCESS": "1"})
+        path = storage._FileStorage__file_path
+        mine = State(name="Nevada")
+        storage.new(mine)
+        storage.save()
+        theirs = State(name="Arizona")
+
+        def worker():
+            """Save a new state from another process"""
+            storage.new(theirs)
+            storage.save()
+
+        child = multiprocessing.get_context("fork").Process(target=worker)
+        child.start()
+        child.join()
+        self.assertEqual(child.exitcode, 0)
+        self.assertIsNone(storage.get(State, theirs.id))
+        with mock.patch.object(FileStorage, "_read") as read:
+            storage.close()
+        self.assertFalse(read.called)
+        self.assertEqual(storage.get(State, theirs.id).name, "Arizona")
+        mine.name = "Oregon"
+        storage.save()
+        js = snapshot.load(path)
+        self.assertEqual(js["State." + mine.id]["name"], "Oregon")
+        self.assertEqual(js["State." + theirs.id]["name"], "Arizona")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_interval_durability_coalesces_saves(self):
+        """Test that interval durability writes many saves at once"""
+        storage = self.scratch_storage({"HBNB_FILE_DURABILITY": "interval",
+                                        "HBNB_FILE_FLUSH_MS": "60000"})
+        path = storage._FileStorage__file_path
+        states = [State(name="State {}".format(i)) for i in range(10)]
+        with mock.patch.object(FileStorage, "_save",
+                               autospec=True,
+                               side_effect=FileStorage._save) as save:
+            for state in states:
+                storage.new(state)
+                storage.save()
+            self.assertFalse(os.path.exists(path))
+            storage._FileStorage__flusher.stop()
+        self.assertEqual(save.call_count, 1)
+        js = snapshot.load(path)
+        for state in states:
+            self.assertIn("State." + state.id, js)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_close_keeps_changes_not_flushed(self):
+        """Test that close() does not revert what a pending flush writes"""
+        for lazy in ["0", "1"]:
+            with self.subTest(lazy=lazy):
+                storage = self.scratch_storage({
+                    "HBNB_FILE_DURABILITY": "interval",
+                    "HBNB_FILE_FLUSH_MS": "60000", "HBNB_FILE_LAZY": lazy})
+                path = storage._FileStorage__file_path
+                changed = State(name="Ohio")
+                removed = State(name="Iowa")
+                stored = {"State." + state.id: state.to_dict()
+                          for state in [changed, removed]}
+                snapshot.dump(path, json.dumps(stored))
+                storage.reload()
+                changed = storage.get(State, changed.id)
+                changed.name = "Maine"
+                storage.delete(storage.get(State, removed.id))
+                self.addCleanup(storage.delete, changed)
+                storage.save()
+                storage._FileStorage__stamp = None
+                storage.close()
+                self.assertEqual(storage.get(State, changed.id).name,
+                                 "Maine")
+                self.assertIsNone(storage.get(State, removed.id))
+                storage._FileStorage__flusher.stop()
+                js = snapshot.load(path)
+                self.assertEqual(js["State." + changed.id]["name"], "Maine")
+                self.assertNotIn("State." + removed.id, js)
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_save_replaces_file_atomically(self):
+        """Test that save() renames a complete file over the old one"""
+        storage = self.scratch_storage()
+        path = storage._FileStorage__file_path
+        state = State(name="Alaska")
+        storage.new(state)
+        storage.save()
+        with open(path, "rb") as f:
+            saved = f.read()
+        with mock.patch("os.replace", side_effect=OSError("crash")):
+            state.name = "Hawaii"
+            with self.assertRaises(OSError):
+                storage.save()
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), saved)
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["file.json"])
+        storage.save()
+        js = snapshot.load(path)
+        self.assertEqual(js["State." + state.id]["name"], "Hawaii")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_reload_rejects_torn_file(self):
+        """Test that reload() raises instead of starting empty, and that
+        close() keeps the objects it has"""
+        for lazy in ["0", "1"]:
+            with self.subTest(lazy=lazy):
+                storage = self.scratch_storage({"HBNB_FILE_LAZY": lazy})
+                path = storage._FileStorage__file_path
+                self.addCleanup(storage.all)
+                states = [State(name="Maine"), State(name="Texas")]
+                for state in states:
+                    storage.new(state)
+                    self.addCleanup(storage.delete, state)
+                storage.save()
+                with open(path, "rb") as f:
+                    data = f.read()
+                count = storage.count(State)
+                for torn in [data[:len(data) // 2],
+                             data.replace(b"Maine", b"Mains")]:
+                    with open(path, "wb") as f:
+                        f.write(torn)
+                    with self.assertRaises(ValueError):
+                        storage.reload()
+                    storage._FileStorage__stamp = None
+                    storage.close()
+                    self.assertEqual(storage.count(State), count)
+                    self.assertEqual(storage.get(State, states[0].id).name,
+                                     "Maine")
+
+    @unittest.skipIf(models.storage_t in ('db', 'sqlite'),
+                     "not testing file storage")
+    def test_concurrent_saves_share_a_write(self):
+        """Test that saves waiting on a running one are written by it"""
+        storage = self.scratch_storage()
+        started = threading.Event()
+        release = threading.Event()
+        save = FileStorage._save
+
+        def slow_save(self, dirty, deleted):
+            """Hold the first write until the other saves are queued"""
+            started.set()
+            release.wait(5)
+            save(self, dirty, deleted)
+
+        with mock.patch.object(FileStorage, "_save", autospec=True,
+                               side_effect=slow_save) as saves:
+            queued = FileStorage._FileStorage__requested + 3
+            storage.new(State(name="Alabama"))
+            first = threading.Thread(target=storage.save)
+            first.start()
+            started.wait(5)
+            states = [State(name="Georgia"), State(name="Florida")]
+            others = []
+            for state in states:
+                storage.new(state)
+                others.append(threading.Thread(target=storage.save))
+                others[-1].start()
+            deadline = time.monotonic() + 5
+            while FileStorage._FileStorage__requested < queued and \
+                    time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            for thread in [first] + others:
+                thread.join()
+        self.assertEqual(saves.call_count, 2)
+        js = snapshot.load(storage._FileStorage__file_path)
+        for state in states:
+            self.assertIn("State." + state.id, js)
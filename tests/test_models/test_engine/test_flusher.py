@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Contains the TestFlusherDocs and TestFlusher classes
+"""
+
+import inspect
+import pep8
+import threading
+import unittest
+from unittest import mock
+from models.engine import flusher
+
+Flusher = flusher.Flusher
+
+
+class TestFlusherDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Flusher class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.flusher_f = inspect.getmembers(Flusher, inspect.isfunction)
+
+    def test_pep8_conformance_flusher(self):
+        """Test that models/engine/flusher.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/flusher.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_flusher(self):
+        """Test tests/test_models/test_engine/test_flusher.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_flusher.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_flusher_module_docstring(self):
+        """Test for the flusher.py module docstring"""
+        self.assertIsNot(flusher.__doc__, None,
+                         "flusher.py needs a docstring")
+        self.assertTrue(len(flusher.__doc__) >= 1,
+                        "flusher.py needs a docstring")
+
+    def test_flusher_class_docstring(self):
+        """Test for the Flusher class docstring"""
+        self.assertIsNot(Flusher.__doc__, None,
+                         "Flusher class needs a docstring")
+        self.assertTrue(len(Flusher.__doc__) >= 1,
+                        "Flusher class needs a docstring")
+
+    def test_flusher_func_docstrings(self):
+        """Test for the presence of docstrings in Flusher methods"""
+        for func in self.flusher_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestFlusher(unittest.TestCase):
+    """Test the Flusher class"""
+    def test_interval_coalesces_requests(self):
+        """Test that requests within the interval share one flush"""
+        flush = mock.Mock()
+        f = Flusher(flush, interval=60)
+        for i in range(100):
+            f.request()
+        self.assertFalse(flush.called)
+        f.stop()
+        self.assertEqual(flush.call_count, 1)
+
+    def test_wait_blocks_until_flushed(self):
+        """Test that waiting requests return once their flush is done"""
+        flush = mock.Mock()
+        f = Flusher(flush, wait=True)
+        threads = [threading.Thread(target=f.request) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(1 <= flush.call_count <= 20)
+        f.stop()
+
+    def test_wait_raises_flush_error(self):
+        """Test that a waiting request raises the error of its flush"""
+        f = Flusher(mock.Mock(side_effect=OSError("disk full")), wait=True)
+        with self.assertRaises(OSError):
+            f.request()
+        f.stop()
+
+    def test_request_after_stop_flushes_at_once(self):
+        """Test that requests made after stop() flush in the caller"""
+        flush = mock.Mock()
+        f = Flusher(flush, interval=60)
+        f.stop()
+        f.request()
+        self.assertEqual(flush.call_count, 1)
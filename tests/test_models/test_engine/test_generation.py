@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""
+Contains the TestGenerationDocs and TestGeneration classes
+"""
+
+import fcntl
+import inspect
+import os
+import pep8
+import tempfile
+import unittest
+from models.engine import generation
+
+Generation = generation.Generation
+
+
+class TestGenerationDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Generation class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.generation_f = inspect.getmembers(Generation, inspect.isfunction)
+
+    def test_pep8_conformance_generation(self):
+        """Test that models/engine/generation.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/generation.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_generation(self):
+        """Test tests/test_models/test_engine/test_generation.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_generation.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_generation_module_docstring(self):
+        """Test for the generation.py module docstring"""
+        self.assertIsNot(generation.__doc__, None,
+                         "generation.py needs a docstring")
+        self.assertTrue(len(generation.__doc__) >= 1,
+                        "generation.py needs a docstring")
+
+    def test_generation_class_docstring(self):
+        """Test for the Generation class docstring"""
+        self.assertIsNot(Generation.__doc__, None,
+                         "Generation class needs a docstring")
+        self.assertTrue(len(Generation.__doc__) >= 1,
+                        "Generation class needs a docstring")
+
+    def test_generation_func_docstrings(self):
+        """Test for the presence of docstrings in Generation methods"""
+        for func in self.generation_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestGeneration(unittest.TestCase):
+    """Test the Generation class"""
+    def setUp(self):
+        """Create two processes' views of one scratch file"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "file.json")
+        self.writer = Generation(path)
+        self.reader = Generation(path)
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp.cleanup()
+
+    def test_pull_returns_changes_since_last_pull(self):
+        """Test that pull() only returns the generations not seen yet"""
+        self.assertFalse(self.reader.changed())
+        self.writer.push({"A.1": {"id": "1"}})
+        self.writer.push({"A.1": None, "A.2": {"id": "2"}})
+        self.assertTrue(self.reader.changed())
+        self.assertEqual(self.reader.pull(),
+                         {"A.1": None, "A.2": {"id": "2"}})
+        self.assertEqual(self.reader.value, 2)
+        self.assertFalse(self.reader.changed())
+        self.writer.push({"A.3": {"id": "3"}})
+        self.assertEqual(self.reader.pull(), {"A.3": {"id": "3"}})
+
+    def test_restarted_log(self):
+        """Test that a reader behind a restarted log must read everything"""
+        self.writer.max_size = 1
+        self.writer.push({"A.1": {"id": "1"}})
+        self.writer.push({"A.2": {"id": "2"}})
+        self.assertIsNone(self.reader.pull())
+        self.reader.skip()
+        self.assertEqual(self.reader.value, 2)
+        self.writer.push({"A.3": {"id": "3"}})
+        self.assertEqual(self.reader.pull(), {"A.3": {"id": "3"}})
+
+    def test_locked_is_exclusive(self):
+        """Test that the exclusive lock keeps other lockers out"""
+        with self.writer.locked():
+            with open(self.reader.lock_path, 'a') as f:
+                with self.assertRaises(BlockingIOError):
+                    fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        with self.reader.locked(exclusive=False):
+            pass
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+Contains the TestJournalDocs and TestJournal classes
+"""
+
+import inspect
+import json
+import os
+import pep8
+import tempfile
+import unittest
+from models.engine import journal
+from models.engine import snapshot
+
+Journal = journal.Journal
+
+
+class TestJournalDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Journal class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.journal_f = inspect.getmembers(Journal, inspect.isfunction)
+
+    def test_pep8_conformance_journal(self):
+        """Test that models/engine/journal.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/journal.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_journal(self):
+        """Test tests/test_models/test_engine/test_journal.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_journal.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_journal_module_docstring(self):
+        """Test for the journal.py module docstring"""
+        self.assertIsNot(journal.__doc__, None,
+                         "journal.py needs a docstring")
+        self.assertTrue(len(journal.__doc__) >= 1,
+                        "journal.py needs a docstring")
+
+    def test_journal_class_docstring(self):
+        """Test for the Journal class docstring"""
+        self.assertIsNot(Journal.__doc__, None,
+                         "Journal class needs a docstring")
+        self.assertTrue(len(Journal.__doc__) >= 1,
+                        "Journal class needs a docstring")
+
+    def test_journal_func_docstrings(self):
+        """Test for the presence of docstrings in Journal methods"""
+        for func in self.journal_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestJournal(unittest.TestCase):
+    """Test the Journal class"""
+    def setUp(self):
+        """Create a journal in a scratch directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "file.json")
+        self.journal = Journal(self.path)
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.journal.wait()
+        self.tmp.cleanup()
+
+    def test_load_replays_log_over_snapshot(self):
+        """Test that load() applies puts and deletes to the snapshot"""
+        with open(self.path, 'w') as f:
+            json.dump({"A.1": {"id": "1"}, "A.2": {"id": "2"}}, f)
+        self.journal.append([("A.1", None), ("A.3", {"id": "3"})])
+        self.assertEqual(self.journal.load(),
+                         {"A.2": {"id": "2"}, "A.3": {"id": "3"}})
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_load_ignores_torn_record(self):
+        """Test that a half-written last record is skipped"""
+        self.journal.append([("A.1", {"id": "1"})])
+        with open(self.journal.path, 'a') as f:
+            f.write('{"op": "put", "key": "A.2", "val')
+        self.assertEqual(self.journal.load(), {"A.1": {"id": "1"}})
+
+    def test_append_after_torn_record(self):
+        """Test that records appended after a torn one are replayed"""
+        self.journal.append([("A.1", {"id": "1"})])
+        with open(self.journal.path, 'a') as f:
+            f.write('{"op": "put", "key": "A.2", "val')
+        self.journal.append([("A.3", {"id": "3"})])
+        expected = {"A.1": {"id": "1"}, "A.3": {"id": "3"}}
+        self.assertEqual(Journal(self.path).load(), expected)
+        self.journal.compact()
+        self.journal.wait()
+        self.assertFalse(os.path.exists(self.journal.compacting_path))
+        self.assertEqual(Journal(self.path).load(), expected)
+
+    def test_compaction(self):
+        """Test that passing max_size folds the log into the snapshot"""
+        self.journal.max_size = 1
+        self.journal.append([("A.1", {"id": "1"})])
+        self.journal.wait()
+        self.assertFalse(os.path.exists(self.journal.path))
+        self.assertFalse(os.path.exists(self.journal.compacting_path))
+        self.assertEqual(snapshot.load(self.path), {"A.1": {"id": "1"}})
+        self.journal.append([("A.1", None)])
+        self.journal.wait()
+        self.assertEqual(self.journal.load(), {})
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Contains the TestRWLockDocs and TestRWLock classes
+"""
+
+import inspect
+import pep8
+import threading
+import unittest
+from models.engine import rwlock
+
+RWLock = rwlock.RWLock
+
+
+class TestRWLockDocs(unittest.TestCase):
+    """Tests to check the documentation and style of RWLock class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.rwlock_f = inspect.getmembers(RWLock, inspect.isfunction)
+
+    def test_pep8_conformance_rwlock(self):
+        """Test that models/engine/rwlock.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/rwlock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_rwlock(self):
+        """Test tests/test_models/test_engine/test_rwlock.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_rwlock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_rwlock_module_docstring(self):
+        """Test for the rwlock.py module docstring"""
+        self.assertIsNot(rwlock.__doc__, None,
+                         "rwlock.py needs a docstring")
+        self.assertTrue(len(rwlock.__doc__) >= 1,
+                        "rwlock.py needs a docstring")
+
+    def test_rwlock_class_docstring(self):
+        """Test for the RWLock class docstring"""
+        self.assertIsNot(RWLock.__doc__, None,
+                         "RWLock class needs a docstring")
+        self.assertTrue(len(RWLock.__doc__) >= 1,
+                        "RWLock class needs a docstring")
+
+    def test_rwlock_func_docstrings(self):
+        """Test for the presence of docstrings in RWLock methods"""
+        for func in self.rwlock_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestRWLock(unittest.TestCase):
+    """Test the RWLock class"""
+    def test_readers_share_the_lock(self):
+        """Test that a second reader gets in while the first one reads"""
+        lock = RWLock()
+        inside = threading.Event()
+        with lock.read():
+            thread = threading.Thread(target=self.read_once,
+                                      args=(lock, inside))
+            thread.start()
+            self.assertTrue(inside.wait(5))
+        thread.join()
+
+    def test_writer_excludes_readers(self):
+        """Test that readers wait for the writer to finish"""
+        lock = RWLock()
+        inside = threading.Event()
+        with lock.write():
+            thread = threading.Thread(target=self.read_once,
+                                      args=(lock, inside))
+            thread.start()
+            self.assertFalse(inside.wait(0.1))
+        self.assertTrue(inside.wait(5))
+        thread.join()
+
+    def test_writer_is_reentrant(self):
+        """Test that a writer can write and read again"""
+        lock = RWLock()
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        with lock.write():
+            pass
+
+    def read_once(self, lock, event):
+        """Take the read lock and set event"""
+        with lock.read():
+            event.set()
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+"""
+Contains the TestScannerDocs and TestScanner classes
+"""
+
+import inspect
+import io
+import json
+import pep8
+import unittest
+from models.engine import scanner
+
+
+class TestScannerDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the scanner module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.scanner_f = inspect.getmembers(scanner, inspect.isfunction)
+
+    def test_pep8_conformance_scanner(self):
+        """Test that models/engine/scanner.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/scanner.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_scanner(self):
+        """Test tests/test_models/test_engine/test_scanner.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_scanner.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_scanner_module_docstring(self):
+        """Test for the scanner.py module docstring"""
+        self.assertIsNot(scanner.__doc__, None,
+                         "scanner.py needs a docstring")
+        self.assertTrue(len(scanner.__doc__) >= 1,
+                        "scanner.py needs a docstring")
+
+    def test_scanner_func_docstrings(self):
+        """Test for the presence of docstrings in scanner functions"""
+        for func in self.scanner_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} function needs a docstring".format(func[0]))
+
+
+class TestScanner(unittest.TestCase):
+    """Test the scan function"""
+    records = {"State.1": {"id": "1", "name": "a \"quoted\" {brace}"},
+               "Place.2": {"id": "2", "amenity_ids": ["x", "y"]},
+               "User.é": {"id": "é", "extra": {"nested": [1]}},
+               "City.3": {"id": "3", "name": "café"}}
+
+    def check(self, data, chunk_size):
+        """Test that scan() finds every record of data"""
+        found = {}
+        for key, offset, length in scanner.scan(io.BytesIO(data),
+                                                chunk_size):
+            found[key] = json.loads(data[offset:offset + length])
+        self.assertEqual(found, self.records)
+
+    def test_scan_every_chunk_size(self):
+        """Test that records cut across chunks are still found"""
+        for ensure_ascii in [True, False]:
+            data = json.dumps(self.records, ensure_ascii=ensure_ascii,
+                              indent=1 if ensure_ascii else None).encode()
+            for chunk_size in range(1, 40):
+                with self.subTest(chunk_size=chunk_size):
+                    self.check(data, chunk_size)
+
+    def test_scan_empty_object(self):
+        """Test that an empty object yields nothing"""
+        for data in [b"{}", b" { } "]:
+            self.assertEqual(list(scanner.scan(io.BytesIO(data))), [])
+
+    def test_scan_rejects_torn_object(self):
+        """Test that a file cut before its closing brace raises"""
+        data = json.dumps(self.records).encode()
+        for torn in [b"", data[:len(data) // 2], data[:-1]]:
+            with self.subTest(torn=torn):
+                with self.assertRaises(ValueError):
+                    list(scanner.scan(io.BytesIO(torn), 16))
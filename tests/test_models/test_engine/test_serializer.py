@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Contains the TestSerializerDocs and TestSerializer classes
+"""
+
+from datetime import datetime
+import inspect
+import json
+import pep8
+import unittest
+from unittest import mock
+from models.base_model import BaseModel
+from models.engine import serializer
+
+
+class TestSerializerDocs(unittest.TestCase):
+    """Tests to check the documentation and style of serializer module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.serializer_f = inspect.getmembers(serializer, inspect.isfunction)
+
+    def test_pep8_conformance_serializer(self):
+        """Test that models/engine/serializer.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/serializer.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_serializer(self):
+        """Test tests/test_models/test_engine/test_serializer.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_serializer.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_serializer_module_docstring(self):
+        """Test for the serializer.py module docstring"""
+        self.assertIsNot(serializer.__doc__, None,
+                         "serializer.py needs a docstring")
+        self.assertTrue(len(serializer.__doc__) >= 1,
+                        "serializer.py needs a docstring")
+
+    def test_serializer_func_docstrings(self):
+        """Test for the presence of docstrings in serializer functions"""
+        for func in self.serializer_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} function needs a docstring".format(func[0]))
+
+
+class TestSerializer(unittest.TestCase):
+    """Test the serializer functions with each backend"""
+    data = {"id": "1", "name": "Zoë", "number": 3, "latitude": 1.5,
+            "amenity_ids": ["a", "b"], "description": None,
+            "created_at": datetime(2017, 9, 28, 21, 3, 54, 52298),
+            "updated_at": datetime(2017, 9, 28, 21, 3, 54)}
+    expected = dict(data, created_at="2017-09-28T21:03:54.052298",
+                    updated_at="2017-09-28T21:03:54.000000")
+
+    def check_backend(self):
+        """Test a round trip through dumps, dumpb and loads"""
+        self.assertEqual(json.loads(serializer.dumps(self.data)),
+                         self.expected)
+        self.assertEqual(serializer.loads(serializer.dumpb(self.data)),
+                         self.expected)
+        self.assertEqual(serializer.loads(serializer.dumps(self.data)),
+                         self.expected)
+        with self.assertRaises(TypeError):
+            serializer.dumps({"a": object()})
+        with self.assertRaises(ValueError):
+            serializer.loads('{"a": ')
+
+    @unittest.skipIf(serializer.orjson is None, "orjson is not installed")
+    def test_orjson_backend(self):
+        """Test the orjson backend"""
+        self.check_backend()
+
+    def test_json_backend(self):
+        """Test the standard json fallback"""
+        with mock.patch.object(serializer, "orjson", None):
+            self.check_backend()
+
+    def test_dates_match_to_dict(self):
+        """Test that encoded dates read back as to_dict() formats them"""
+        obj = BaseModel(created_at="2017-09-28T21:03:54.000000",
+                        updated_at="2017-09-28T21:03:54.000001")
+        expected = obj.to_dict()
+        raw = obj.to_dict(format_dates=False)
+        self.assertEqual(serializer.loads(serializer.dumpb(raw)), expected)
+        with mock.patch.object(serializer, "orjson", None):
+            self.assertEqual(serializer.loads(serializer.dumps(raw)),
+                             expected)
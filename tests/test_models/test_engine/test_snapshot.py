@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""
+Contains the TestSnapshotDocs and TestSnapshot classes
+"""
+
+import inspect
+import io
+import json
+import os
+import pep8
+import tempfile
+import unittest
+from models.engine import snapshot
+
+
+class TestSnapshotDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the snapshot module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.snapshot_f = inspect.getmembers(snapshot, inspect.isfunction)
+
+    def test_pep8_conformance_snapshot(self):
+        """Test that models/engine/snapshot.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_snapshot(self):
+        """Test tests/test_models/test_engine/test_snapshot.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_snapshot_module_docstring(self):
+        """Test for the snapshot.py module docstring"""
+        self.assertIsNot(snapshot.__doc__, None,
+                         "snapshot.py needs a docstring")
+        self.assertTrue(len(snapshot.__doc__) >= 1,
+                        "snapshot.py needs a docstring")
+
+    def test_snapshot_func_docstrings(self):
+        """Test for the presence of docstrings in snapshot functions"""
+        for func in self.snapshot_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} function needs a docstring".format(func[0]))
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test the snapshot functions"""
+    def setUp(self):
+        """Create a scratch directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "file.json")
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp.cleanup()
+
+    def test_dump_and_load(self):
+        """Test that load() returns what dump() wrote, without temp files"""
+        snapshot.dump(self.path, json.dumps({"A.1": {"name": "é"}}))
+        self.assertEqual(snapshot.load(self.path), {"A.1": {"name": "é"}})
+        self.assertEqual(os.listdir(self.tmp.name), ["file.json"])
+
+    def test_load_plain_json(self):
+        """Test that files written before the footer still load"""
+        with open(self.path, "w") as f:
+            json.dump({"A.1": {}}, f)
+        self.assertEqual(snapshot.load(self.path), {"A.1": {}})
+
+    def test_load_detects_torn_and_corrupt_files(self):
+        """Test that cut or altered snapshots raise ValueError"""
+        snapshot.dump(self.path, json.dumps({"A.1": {"name": "x"}}))
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for bad in [data[:10], data[:-5], data.replace(b"x", b"y"), b""]:
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError):
+                    snapshot.loads(bad)
+
+    def test_check_footer(self):
+        """Test that check() accepts whole files and rejects altered ones"""
+        snapshot.dump(self.path, json.dumps({"A.1": {"name": "x"}}))
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for good in [data, b'{"A.1": {}}']:
+            with self.subTest(good=good):
+                f = io.BytesIO(good)
+                snapshot.check(f)
+                self.assertEqual(f.tell(), 0)
+        for bad in [data[:-5], data.replace(b"x", b"y"), data[1:]]:
+            with self.subTest(bad=bad):
+                with self.assertRaises(ValueError):
+                    snapshot.check(io.BytesIO(bad))
@@ -0,0 +1,292 @@
+#!/usr/bin/python3
+"""
+Contains the TestSQLiteStorageDocs and TestSQLiteStorage classes
+"""
+
+from api.v1 import app as api_app
+from api.v1.views import states as states_view
+import inspect
+import models
+from models.engine import sqlite_storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import os
+import pep8
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+SQLiteStorage = sqlite_storage.SQLiteStorage
+
+
+class TestSQLiteStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of SQLiteStorage class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.sqls_f = inspect.getmembers(SQLiteStorage, inspect.isfunction)
+
+    def test_pep8_conformance_sqlite_storage(self):
+        """Test that models/engine/sqlite_storage.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_sqlite_storage(self):
+        """Test tests/test_models/test_engine/test_sqlite_storage.py PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_sqlite_storage_module_docstring(self):
+        """Test for the sqlite_storage.py module docstring"""
+        self.assertIsNot(sqlite_storage.__doc__, None,
+                         "sqlite_storage.py needs a docstring")
+        self.assertTrue(len(sqlite_storage.__doc__) >= 1,
+                        "sqlite_storage.py needs a docstring")
+
+    def test_sqlite_storage_class_docstring(self):
+        """Test for the SQLiteStorage class docstring"""
+        self.assertIsNot(SQLiteStorage.__doc__, None,
+                         "SQLiteStorage class needs a docstring")
+        self.assertTrue(len(SQLiteStorage.__doc__) >= 1,
+                        "SQLiteStorage class needs a docstring")
+
+    def test_sqls_func_docstrings(self):
+        """Test for the presence of docstrings in SQLiteStorage methods"""
+        for func in self.sqls_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing sqlite storage")
+class TestSQLiteStorage(unittest.TestCase):
+    """Test the SQLiteStorage class"""
+    def setUp(self):
+        """Open a storage on a scratch database"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "hbnb.db")
+        with mock.patch.dict(os.environ, {"HBNB_SQLITE_PATH": path}):
+            self.storage = SQLiteStorage()
+        self.storage.reload()
+
+    def tearDown(self):
+        """Remove the scratch database"""
+        self.tmp.cleanup()
+
+    def test_wal_and_indexes(self):
+        """Test that reload() enables WAL and indexes foreign keys"""
+        conn = self.storage._SQLiteStorage__conn
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0],
+                         "wal")
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list(Place)")]
+        self.assertIn("Place_city_id", indexes)
+        self.assertIn("Place_user_id", indexes)
+
+    def test_save_writes_changed_rows(self):
+        """Test that save() persists new, modified and deleted objects"""
+        state = State(name="Ohio")
+        other = State(name="Iowa")
+        self.storage.new(state)
+        self.storage.new(other)
+        self.storage.save()
+        self.storage.close()
+        loaded = self.storage.get(State, state.id)
+        self.assertIsNot(loaded, state)
+        self.assertEqual(loaded.to_dict(), state.to_dict())
+        loaded.name = "Utah"
+        self.storage.delete(self.storage.get(State, other.id))
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, state.id).name, "Utah")
+        self.assertIsNone(self.storage.get(State, other.id))
+        self.assertEqual(self.storage.count(State), 1)
+        self.assertEqual(self.storage.count(), 1)
+
+    def test_unsaved_changes_are_dropped_on_close(self):
+        """Test that close() forgets changes that were never saved"""
+        state = State(name="Ohio")
+        self.storage.new(state)
+        self.storage.save()
+        state.name = "Utah"
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, state.id).name, "Ohio")
+
+    def test_related_and_password(self):
+        """Test foreign key lookups and that password hashes are kept"""
+        user = User(email="a@b.c", password="pwd")
+        city = City(name="Akron")
+        place = Place(city_id=city.id, user_id=user.id, name="Loft")
+        for obj in [user, city, place]:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        places = self.storage.related(Place, "city_id", city.id)
+        self.assertEqual([p.id for p in places], [place.id])
+        self.assertEqual(self.storage.get(User, user.id).password,
+                         user.password)
+        self.assertEqual(list(self.storage.all("City")),
+                         ["City." + city.id])
+
+    def test_counts_and_all_in_one_statement(self):
+        """Test that counts() and all() read every table in one query"""
+        state = State(name="Ohio")
+        city = City(name="Akron", state_id=state.id)
+        for obj in [state, city]:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        with mock.patch.object(self.storage, "_query",
+                               wraps=self.storage._query) as query:
+            counts = self.storage.counts()
+            self.assertEqual(query.call_count, 1)
+            self.assertEqual(counts["State"], 1)
+            self.assertEqual(counts["City"], 1)
+            self.assertEqual(counts["User"], 0)
+            self.assertEqual(self.storage.counts([State, "City"]),
+                             {"State": 1, "City": 1})
+            self.assertEqual(sorted(self.storage.all()),
+                             sorted(["State." + state.id, "City." + city.id]))
+            self.assertEqual(query.call_count, 3)
+
+    def test_get_many_in_one_query(self):
+        """Test that get_many() reads the ids not loaded yet in one query"""
+        states = [State(name="State {}".format(i)) for i in range(3)]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        loaded = self.storage.get(State, states[1].id)
+        ids = [states[2].id, "missing", states[1].id, states[0].id]
+        with mock.patch.object(self.storage, "_query",
+                               wraps=self.storage._query) as query:
+            found = self.storage.get_many(State, ids)
+            self.assertEqual(query.call_count, 1)
+        self.assertEqual([s.name for s in found],
+                         ["State 2", "State 1", "State 0"])
+        self.assertIs(found[1], loaded)
+        self.storage.delete(found[0])
+        self.assertEqual(len(self.storage.get_many(State, ids)), 2)
+
+    def test_search_places(self):
+        """Test that search_places() filters by location and amenities"""
+        state = State(name="Ohio")
+        akron = City(name="Akron", state_id=state.id)
+        dayton = City(name="Dayton", state_id="elsewhere")
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        places = [Place(name="Loft", city_id=akron.id,
+                        amenity_ids=[wifi.id, pool.id]),
+                  Place(name="Barn", city_id=akron.id, amenity_ids=[wifi.id]),
+                  Place(name="Yurt", city_id=dayton.id,
+                        amenity_ids=[pool.id, wifi.id])]
+        for obj in [state, akron, dayton, wifi, pool] + places:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        search = self.storage.search_places
+
+        def names(places):
+            """returns the sorted names of places"""
+            return sorted(place.name for place in places)
+
+        self.assertEqual(names(search(states=[state.id])), ["Barn", "Loft"])
+        self.assertEqual(names(search(states=[state.id], cities=[dayton.id],
+                                      amenities=[pool.id, wifi.id])),
+                         ["Loft", "Yurt"])
+        self.assertEqual(search(amenities=[wifi.id, "missing"]), [])
+        ids = sorted(place.id for place in places)
+        self.assertEqual([p.id for p in search(limit=2)], ids[:2])
+        self.assertEqual([p.id for p in search(after=ids[1])], ids[2:])
+
+    def test_page(self):
+        """Test that page() walks a class in keyset order"""
+        states = [State(name=name) for name in ["Utah", "Iowa", "Ohio"]]
+        city = City(name="Akron", state_id=states[0].id)
+        for obj in states + [city]:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        ids = sorted(state.id for state in states)
+        first = self.storage.page(State, limit=2)
+        self.assertEqual([s.id for s in first], ids[:2])
+        rest = self.storage.page(State, after=first[-1].id, limit=2)
+        self.assertEqual([s.id for s in rest], ids[2:])
+        by_name = self.storage.page(State, limit=1, order_by="name")
+        self.assertEqual([s.name for s in by_name], ["Iowa"])
+        self.assertEqual([s.name for s in self.storage.page(
+            State, after=by_name[0].id, order_by="name")], ["Ohio", "Utah"])
+        self.assertEqual([c.id for c in self.storage.page(
+            City, where={"state_id": states[0].id})], [city.id])
+        self.assertEqual(self.storage.page(
+            City, where={"state_id": states[1].id}), [])
+
+    def test_stream(self):
+        """Test that stream() reads a class in batches without keeping it"""
+        states = [State(name=name) for name in ["Utah", "Iowa", "Ohio"]]
+        city = City(name="Akron", state_id=states[0].id)
+        for obj in states + [city]:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        ids = sorted(state.id for state in states)
+        self.assertEqual([s.id for s in self.storage.stream(State, batch=2)],
+                         ids)
+        self.assertEqual(self.storage._SQLiteStorage__pending.objects, {})
+        self.assertEqual([c.id for c in self.storage.stream(
+            City, {"state_id": states[0].id})], [city.id])
+        self.storage.delete(self.storage.get(State, ids[0]))
+        self.assertEqual([s.id for s in self.storage.stream(State, batch=1)],
+                         ids[1:])
+
+    def test_close_keeps_other_threads_changes(self):
+        """Test that close() only forgets the calling thread's changes"""
+        state = State(name="Ohio")
+        self.storage.new(state)
+        closer = threading.Thread(target=self.storage.close)
+        closer.start()
+        closer.join()
+        self.storage.save()
+        self.assertEqual(self.storage.count(State), 1)
+
+    def test_threaded_api_requests(self):
+        """Test that requests served at once keep their own changes"""
+        errors = []
+
+        def work(n):
+            """Create, update and read back states through the API"""
+            client = api_app.app.test_client()
+            for i in range(10):
+                r = client.post("/api/v1/states",
+                                json={"name": "{}-{}".format(n, i)})
+                if r.status_code != 201:
+                    errors.append(("POST", r.status_code))
+                    continue
+                url = "/api/v1/states/" + r.get_json()["id"]
+                r = client.put(url, json={"name": "Ohio"})
+                if r.status_code != 200:
+                    errors.append(("PUT", r.status_code))
+                r = client.get(url)
+                if r.status_code != 200 or r.get_json()["name"] != "Ohio":
+                    errors.append(("GET", r.status_code))
+
+        with mock.patch.object(models, "storage", self.storage), \
+                mock.patch.object(api_app, "storage", self.storage), \
+                mock.patch.object(states_view, "storage", self.storage):
+            threads = [threading.Thread(target=work, args=(n,))
+                       for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.storage.count(State), 80)
@@ -130,3 +130,18 @@ class TestUser(unittest.TestCase):
         user = User()
         string = "[User] ({}) {}".format(user.id, user.__dict__)
         self.assertEqual(string, str(user))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_from_dict_keeps_password_hash(self):
+        """test that loading a stored user does not hash its hash again"""
+        user = User(email="a@b.c", password="secret")
+        loaded = User.from_dict(user.to_dict(save_fs=1))
+        self.assertEqual(loaded.password, user.password)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_to_dict_keeps_password_private(self):
+        """test that only the stored dict includes the password"""
+        user = User(email="a@b.c", password="secret")
+        self.assertIn("password", user.to_dict(save_fs=1))
+        self.assertNotIn("password", user.to_dict())
+        self.assertIn("password", user.to_dict(save_fs=1))